@@ -1,47 +1,218 @@
 from __future__ import annotations
 
+import copy
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
 from typing import Any
 
+import jinja2
+from anyio import to_thread
 from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
-from opensearchpy import OpenSearch
+from opensearchpy import OpenSearch, Urllib3HttpConnection
+from sqlalchemy.orm import sessionmaker
 
 from .config import Settings
-from .db import Base, create_session_factory
+from .db import Base, create_session_factory, ensure_schema
+from .indexer import search_serializer
 from .models import Paper
-from .utils import license_permits_pdf_storage
+from .msearch import SearchBatcher
+from .utils import TTLCache, license_permits_pdf_storage
+
+# Worker threads for the sync handlers, and search connections kept alive: one per worker,
+# so a handler waiting on OpenSearch never has to open (and then discard) a connection
+API_THREADPOOL_SIZE = int(os.environ.get("API_THREADPOOL_SIZE", "64"))
 
 
 @asynccontextmanager
 async def _lifespan(_: FastAPI):
-    # Ensure DB schema exists on startup
+    # Resolve settings and the DB engine/pool once; request handlers reuse them via app.state
     settings = Settings.from_env()
     session_factory = create_session_factory(settings.database_url)
+    app.state.settings = settings
+    app.state.session_factory = session_factory
+    # Ensure DB schema exists on startup
     with session_factory() as session:
         engine = session.get_bind()
-        Base.metadata.create_all(engine)
+        ensure_schema(Base, engine)
+    if settings.enable_semantic:
+        # Warm the re-ranking model so the first semantic request doesn't pay the load cost
+        with suppress(Exception):
+            _load_model(settings.semantic_model, settings.semantic_quantize)
+    # Sync handlers run in anyio's worker pool (40 threads by default); size it like the
+    # search connection pool so handlers waiting on OpenSearch don't queue behind each other
+    to_thread.current_default_thread_limiter().total_tokens = API_THREADPOOL_SIZE
+    # Compile the UI template up front; the environment caches it for every later render
+    templates.get_template("ui_search.html")
+    # Build the search client once so every request reuses its keep-alive connection pool
+    app.state.search_client = _build_client()
+    # Optional: coalesce concurrent searches into one _msearch call (SEARCH_BATCH_WINDOW_MS>0)
+    window_ms = float(os.environ.get("SEARCH_BATCH_WINDOW_MS", "0"))
+    if window_ms > 0:
+        app.state.search_batcher = SearchBatcher(
+            app.state.search_client,
+            INDEX_NAME,
+            window_seconds=window_ms / 1000.0,
+            filter_path=SEARCH_FILTER_PATH,
+            preference=SEARCH_PREFERENCE,
+        )
     yield
+    batcher = getattr(app.state, "search_batcher", None)
+    if batcher is not None:
+        batcher.close()
+        app.state.search_batcher = None
 
 
 app = FastAPI(title="Literature Search API", version="0.2.0", lifespan=_lifespan)
-templates = Jinja2Templates(directory="src/ingestion/templates")
+# Templates are static at runtime: skip the per-render mtime check (auto_reload)
+templates = Jinja2Templates(
+    env=jinja2.Environment(
+        loader=jinja2.FileSystemLoader("src/ingestion/templates"),
+        autoescape=True,
+        auto_reload=False,
+    )
+)
 
 
-def _get_client() -> OpenSearch:
+def _build_client() -> OpenSearch:
     host = os.environ.get("SEARCH_HOST", "http://localhost:9200")
-    return OpenSearch(hosts=[host])
+    # Pin the urllib3 transport (rather than requests) with a pool sized for the threadpool
+    return OpenSearch(
+        hosts=[host],
+        connection_class=Urllib3HttpConnection,
+        pool_maxsize=API_THREADPOOL_SIZE,
+        http_compress=True,
+        serializer=search_serializer(),
+        timeout=10,
+        max_retries=2,
+        retry_on_timeout=True,
+    )
+
+
+def _get_client() -> OpenSearch:
+    client = getattr(app.state, "search_client", None)
+    if client is None:
+        # Lifespan did not run (e.g. TestClient without a context manager); build lazily
+        client = app.state.search_client = _build_client()
+    return client
+
+
+def _get_settings() -> Settings:
+    settings = getattr(app.state, "settings", None)
+    return settings if settings is not None else Settings.from_env()
+
+
+def _get_session_factory(settings: Settings) -> sessionmaker:
+    session_factory = getattr(app.state, "session_factory", None)
+    if session_factory is None:
+        # Lifespan did not run; fall back to a per-call factory for the current environment
+        session_factory = create_session_factory(settings.database_url)
+    return session_factory
+
+
+@lru_cache(maxsize=4)
+def _load_model(name: str, quantize: str = "none") -> Any:
+    """Load a sentence-transformer once per process; the import itself is deferred too.
+
+    ``quantize="int8"`` applies dynamic int8 quantization to Linear layers on CPU and
+    ``quantize="fp16"`` casts to half precision when CUDA is available.
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer  # type: ignore
+
+    model = SentenceTransformer(name)
+    if quantize == "fp16" and torch.cuda.is_available():
+        model = model.half()
+    elif quantize == "int8" and model.device.type == "cpu":
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return model
+
+
+@lru_cache(maxsize=2048)
+def _embed_query(model_name: str, quantize: str, q: str) -> tuple[float, ...]:
+    """Normalized query embedding, memoized so repeated queries skip the forward pass."""
+    model = _load_model(model_name, quantize)
+    return tuple(model.encode([q], normalize_embeddings=True)[0].tolist())
 
 
 INDEX_NAME = os.environ.get("SEARCH_INDEX", "papers")
 
 
+# Trim shard stats, timings and max_score server-side; only these parts of a response are read
+SEARCH_FILTER_PATH = "hits.total.value,hits.hits._id,hits.hits._score,hits.hits._source"
+# Optional stable routing key: repeated queries hit the same shard copies and their warm caches
+SEARCH_PREFERENCE = os.environ.get("SEARCH_PREFERENCE") or None
+
+
+def _run_search(client: OpenSearch, body: dict[str, Any]) -> dict[str, Any]:
+    batcher = getattr(app.state, "search_batcher", None)
+    if batcher is not None:
+        return batcher.search(body)
+    params = {"filter_path": SEARCH_FILTER_PATH}
+    if SEARCH_PREFERENCE:
+        params["preference"] = SEARCH_PREFERENCE
+    return client.search(index=INDEX_NAME, body=body, params=params)
+
+
+_MATCH_FIELDS = ["title^2", "abstract", "summary"]
+_TOTAL_HITS_CAP = 10000
+_SORT_RECENCY = [{"fetched_at": {"order": "desc"}}]
+_SORT_CITATIONS = [{"citation_count": {"order": "desc"}}]
+
+
+def _keyword_query(q: str) -> dict[str, Any]:
+    # Explicit best_fields: score by the best-matching field, with a small boost from the others
+    return {
+        "multi_match": {
+            "query": q,
+            "type": "best_fields",
+            "fields": _MATCH_FIELDS,
+            "tie_breaker": 0.3,
+        }
+    }
+
+
+# _source projections: only ship the fields each endpoint actually returns or renders
+_SEARCH_SOURCE_FIELDS = [
+    "title",
+    "abstract",
+    "summary",
+    "year",
+    "citation_count",
+    "authors",
+    "license",
+    "source",
+    "fetched_at",
+    "doi",
+    "venue",
+    "concepts",
+]
+_UI_SOURCE_FIELDS = ["title", "abstract", "summary", "year", "citation_count", "license"]
+_SUMMARY_SOURCE_FIELDS = ["title", "abstract", "summary", "year", "citation_count"]
+
+
+def _idof(hit: dict[str, Any]) -> Any:
+    # Document ids are DB primary keys; fall back to the raw _id for anything non-numeric
+    raw = hit.get("_id")
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        return raw
+
+
+# Short-lived result cache for identical repeated queries (SEARCH_CACHE_TTL_SECONDS=0 disables).
+# Reindexing runs in another process, so entries are only invalidated by the TTL.
+_result_cache = TTLCache(
+    maxsize=1024, ttl_seconds=float(os.environ.get("SEARCH_CACHE_TTL_SECONDS", "60"))
+)
+_MISS = object()
+
+
 @app.get("/paper/{paper_id}")
 def get_paper(paper_id: int) -> dict[str, Any]:
-    settings = Settings.from_env()
-    session_factory = create_session_factory(settings.database_url)
+    session_factory = _get_session_factory(_get_settings())
     with session_factory() as session:
         paper = session.get(Paper, paper_id)
         if not paper:
@@ -79,25 +250,29 @@ def search(
     sort: str = Query("recency", description="recency|citations"),
     size: int = Query(20, ge=1, le=100),
 ) -> dict[str, Any]:
+    cache_key = (
+        "search",
+        q,
+        author,
+        year_start,
+        year_end,
+        license,
+        source,
+        sort,
+        size,
+    )
+    cached = _result_cache.get(cache_key, _MISS)
+    if cached is not _MISS:
+        return copy.deepcopy(cached)
+
     client = _get_client()
-    settings = Settings.from_env()
+    settings = _get_settings()
 
     must: list[dict[str, Any]] = []
     filter_q: list[dict[str, Any]] = []
 
     if q:
-        must.append(
-            {
-                "multi_match": {
-                    "query": q,
-                    "fields": [
-                        "title^2",
-                        "abstract",
-                        "summary",
-                    ],
-                }
-            }
-        )
+        must.append(_keyword_query(q))
     if author:
         filter_q.append({"term": {"authors": author}})
     if year_start is not None or year_end is not None:
@@ -112,29 +287,42 @@ def search(
     if source:
         filter_q.append({"term": {"source": source}})
 
-    sort_clause = [{"fetched_at": {"order": "desc"}}]
-    if sort == "citations":
-        sort_clause = [{"citation_count": {"order": "desc"}}]
+    sort_clause = _SORT_CITATIONS if sort == "citations" else _SORT_RECENCY
 
-    query = {"bool": {"must": must or {"match_all": {}}, "filter": filter_q}}
+    # Results are always field-sorted; without a keyword there is nothing worth scoring
+    query: dict[str, Any]
+    if must:
+        query = {"bool": {"must": must, "filter": filter_q}}
+    else:
+        query = {"constant_score": {"filter": {"bool": {"filter": filter_q}}}}
 
-    res = client.search(
-        index=INDEX_NAME, body={"query": query, "size": size * 2, "sort": sort_clause}
-    )
-    hits = [
+    # Over-fetch candidates only when they will be semantically re-ranked, and never beyond topk
+    rerank = bool(settings.enable_semantic and q)
+    fetch_size = max(size, min(size * 2, settings.semantic_topk)) if rerank else size
+    res = _run_search(
+        client,
         {
-            "id": int(h.get("_id")) if str(h.get("_id")).isdigit() else h.get("_id"),
-            "score": h.get("_score"),
-            **h.get("_source", {}),
-        }
-        for h in res.get("hits", {}).get("hits", [])
-    ]
+            "query": query,
+            "size": fetch_size,
+            "sort": sort_clause,
+            # Count exactly up to the cap only; "total" is reported as a lower bound beyond it
+            "track_total_hits": _TOTAL_HITS_CAP,
+            "_source": {"includes": _SEARCH_SOURCE_FIELDS},
+        },
+    )
+    hits: list[dict[str, Any]] = []
+    for h in res.get("hits", {}).get("hits", []):
+        src = h.get("_source") or {}
+        hit = {"id": _idof(h), "score": h.get("_score")}
+        for field in _SEARCH_SOURCE_FIELDS:
+            hit[field] = src.get(field)
+        hits.append(hit)
     # Optional semantic re-ranking
-    if settings.enable_semantic and q and hits:
+    if rerank and hits:
         try:
-            from sentence_transformers import SentenceTransformer, util  # type: ignore
+            import numpy as np
 
-            model = SentenceTransformer(settings.semantic_model)
+            model = _load_model(settings.semantic_model, settings.semantic_quantize)
 
             # Prepare texts to embed (prefer summary, then abstract, then title)
             def _text(item: dict[str, Any]) -> str:
@@ -143,9 +331,15 @@ def search(
             topk = max(1, min(len(hits), settings.semantic_topk))
             subset = hits[:topk]
             corpus_texts = [_text(h) for h in subset]
-            query_emb = model.encode([q], normalize_embeddings=True)[0]
-            corpus_embs = model.encode(corpus_texts, normalize_embeddings=True)
-            sims = util.cos_sim(query_emb, corpus_embs).tolist()[0]
+            query_emb = np.asarray(
+                _embed_query(settings.semantic_model, settings.semantic_quantize, q),
+                dtype=np.float32,
+            )
+            corpus_embs = model.encode(
+                corpus_texts, normalize_embeddings=True, convert_to_numpy=True, batch_size=topk
+            )
+            # Embeddings are L2-normalized, so cosine similarity is a plain dot product
+            sims = corpus_embs @ query_emb
 
             # Compute blended score: semantic + citations + recency
             def _safe(v: Any, default: float = 0.0) -> float:
@@ -159,8 +353,8 @@ def search(
                 y = _safe(item.get("year"))
                 return y / 2100.0  # scale roughly into 0..1
 
-            for i, item in enumerate(subset):
-                semantic = float(sims[i])
+            for item, sim in zip(subset, sims, strict=True):
+                semantic = float(sim)
                 citations = _safe(item.get("citation_count"))
                 blended = (
                     settings.weight_semantic * semantic
@@ -179,12 +373,14 @@ def search(
                     },
                 }
             subset.sort(key=lambda x: x.get("_blended_score", 0.0), reverse=True)
-            hits = subset[:size]
+            hits = (subset + hits[topk:])[:size]
         except Exception:
             hits = hits[:size]
     else:
         hits = hits[:size]
-    return {"total": res.get("hits", {}).get("total", {}).get("value", 0), "hits": hits}
+    result = {"total": res.get("hits", {}).get("total", {}).get("value", 0), "hits": hits}
+    _result_cache.set(cache_key, copy.deepcopy(result))
+    return result
 
 
 @app.get("/ui/search", response_class=HTMLResponse)
@@ -192,56 +388,69 @@ def ui_search(
     request: Request,
     q: str | None = Query(None, description="Keyword query"),
     size: int = Query(20, ge=1, le=100),
-) -> HTMLResponse:
-    client = _get_client()
-    must: list[dict[str, Any]] = []
-    if q:
-        must.append(
+) -> StreamingResponse:
+    cache_key = ("ui_search", q, size)
+    hits = _result_cache.get(cache_key, _MISS)
+    if hits is _MISS:
+        client = _get_client()
+        must: list[dict[str, Any]] = []
+        if q:
+            must.append(_keyword_query(q))
+        query = {"bool": {"must": must}} if must else {"match_all": {}}
+        res = _run_search(
+            client,
             {
-                "multi_match": {
-                    "query": q,
-                    "fields": ["title^2", "abstract", "summary"],
-                }
-            }
+                "query": query,
+                "size": size,
+                "sort": _SORT_RECENCY,
+                # The UI never shows a total
+                "track_total_hits": False,
+                "_source": {"includes": _UI_SOURCE_FIELDS},
+            },
         )
-    query = {"bool": {"must": must or {"match_all": {}}}}
-    res = client.search(
-        index=INDEX_NAME,
-        body={"query": query, "size": size, "sort": [{"fetched_at": {"order": "desc"}}]},
-    )
-    hits = [
-        {
-            "id": int(h.get("_id")) if str(h.get("_id")).isdigit() else h.get("_id"),
-            **(h.get("_source", {}) or {}),
-        }
-        for h in res.get("hits", {}).get("hits", [])
-    ][:size]
+        hits = []
+        for h in res.get("hits", {}).get("hits", [])[:size]:
+            src = h.get("_source") or {}
+            hit = {"id": _idof(h)}
+            for field in _UI_SOURCE_FIELDS:
+                hit[field] = src.get(field)
+            hits.append(hit)
+        _result_cache.set(cache_key, hits)
     # Render table with inline summary and expandable sections when available
-    return templates.TemplateResponse(
-        "ui_search.html",
+    # Stream the rendered page in buffered chunks rather than building one large string
+    stream = templates.get_template("ui_search.html").stream(
         {
             "request": request,
             "q": q or "",
             "items": hits,
-        },
+        }
     )
+    stream.enable_buffering(64)
+    return StreamingResponse(stream, media_type="text/html")
 
 
 @app.get("/summaries")
 def get_summaries(q: str | None = None, size: int = 10) -> dict[str, Any]:
     """Return summaries for top-N matches for a query (or latest if no query)."""
+    cache_key = ("summaries", q, size)
+    cached = _result_cache.get(cache_key, _MISS)
+    if cached is not _MISS:
+        return copy.deepcopy(cached)
+
     client = _get_client()
     if q:
-        query: dict[str, Any] = {
-            "bool": {
-                "must": {"multi_match": {"query": q, "fields": ["title^2", "abstract", "summary"]}}
-            }
-        }
+        query: dict[str, Any] = {"bool": {"must": _keyword_query(q)}}
     else:
         query = {"match_all": {}}
-    res = client.search(
-        index=INDEX_NAME,
-        body={"query": query, "size": size, "sort": [{"fetched_at": {"order": "desc"}}]},
+    res = _run_search(
+        client,
+        {
+            "query": query,
+            "size": size,
+            "sort": _SORT_RECENCY,
+            "track_total_hits": _TOTAL_HITS_CAP,
+            "_source": {"includes": _SUMMARY_SOURCE_FIELDS},
+        },
     )
     items: list[dict[str, Any]] = []
     for h in res.get("hits", {}).get("hits", []):
@@ -256,4 +465,6 @@ def get_summaries(q: str | None = None, size: int = 10) -> dict[str, Any]:
                 "citation_count": src.get("citation_count"),
             }
         )
-    return {"total": res.get("hits", {}).get("total", {}).get("value", 0), "items": items}
+    result = {"total": res.get("hits", {}).get("total", {}).get("value", 0), "items": items}
+    _result_cache.set(cache_key, copy.deepcopy(result))
+    return result
@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from .utils import http_get_json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from .utils import HttpResponseCache, http_get_json
+
+WORKS_URL = "https://api.openalex.org/works"
+# Only the fields the neighbor expansion reads; full Work records are several KB each
+_SEED_SELECT = {"select": "id,referenced_works,cited_by_api_url"}
+# Seeds are revisited on every rebuild; keep responses on disk (HTTP_CACHE_DIR="" disables)
+_CACHE_DIR = os.environ.get("HTTP_CACHE_DIR", "./data/http_cache")
+_cache = HttpResponseCache(os.path.join(_CACHE_DIR, "openalex")) if _CACHE_DIR else None
 
 
 def fetch_openalex_neighbors(seed_doi: str) -> list[str]:
@@ -9,9 +20,9 @@ def fetch_openalex_neighbors(seed_doi: str) -> list[str]:
     Strategy for reliability against API changes:
       1) Resolve the seed work via /works/doi:{seed} to get 'cited_by_api_url' and 'referenced_works'.
       2) Use 'cited_by_api_url' (if present) to fetch citations (first page, 25 items).
-      3) For references, dereference each Work ID to extract DOI (up to 25).
+      3) For references, resolve up to 25 Work IDs to DOIs with one OR-filtered request.
     """
-    base = "https://api.openalex.org/works"
+    base = WORKS_URL
     dois: set[str] = set()
 
     # Resolve seed work to get helpers
@@ -19,26 +30,31 @@ def fetch_openalex_neighbors(seed_doi: str) -> list[str]:
     try:
         seed = http_get_json(
             f"{base}/doi:{seed_doi}",
+            params=_SEED_SELECT,
             timeout_seconds=30,
             source_name="openalex",
             min_interval_seconds=0.5,
+            cache=_cache,
         )
     except Exception:
         try:
             seed = http_get_json(
                 f"{base}/https://doi.org/{seed_doi}",
+                params=_SEED_SELECT,
                 timeout_seconds=30,
                 source_name="openalex",
                 min_interval_seconds=0.5,
+                cache=_cache,
             )
         except Exception:
             # Final fallback: generic search by DOI string to resolve the Work
             search_res = http_get_json(
                 base,
-                params={"search": seed_doi, "per_page": "1"},
+                params={"search": seed_doi, "per_page": "1", "select": "id"},
                 timeout_seconds=30,
                 source_name="openalex",
                 min_interval_seconds=0.5,
+                cache=_cache,
             )
             first = (search_res.get("results") or [])[:1]
             if not first:
@@ -48,58 +64,74 @@ def fetch_openalex_neighbors(seed_doi: str) -> list[str]:
                 return []
             seed = http_get_json(
                 wid,
+                params=_SEED_SELECT,
                 timeout_seconds=30,
                 source_name="openalex",
                 min_interval_seconds=0.5,
+                cache=_cache,
             )
 
-    # 1) Who cites the seed: use the provided API URL when available
-    cited_by_url = seed.get("cited_by_api_url")
-    if isinstance(cited_by_url, str) and cited_by_url:
-        try:
-            cited = http_get_json(
-                cited_by_url,
-                params={"per_page": "25"},
-                timeout_seconds=30,
-                source_name="openalex",
-                min_interval_seconds=0.5,
-            )
-            for it in cited.get("results", [])[:25]:
-                doi_val = it.get("doi")
-                if isinstance(doi_val, str) and doi_val:
-                    dois.add(doi_val)
-        except Exception:  # noqa: BLE001
-            pass
-    else:
-        # If not provided, try {work_id}/cited-by endpoint
-        wid = seed.get("id")
-        if isinstance(wid, str) and wid:
-            try:
-                cited = http_get_json(
-                    f"{wid}/cited-by",
-                    params={"per_page": "25"},
-                    timeout_seconds=30,
-                    source_name="openalex",
-                    min_interval_seconds=0.5,
-                )
-                for it in cited.get("results", [])[:25]:
-                    doi_val = it.get("doi")
-                    if isinstance(doi_val, str) and doi_val:
-                        dois.add(doi_val)
-            except Exception:  # noqa: BLE001
-                pass
-
-    # 2) References of the seed: dereference work IDs to DOIs (best-effort)
+    # 1) Who cites the seed and 2) what the seed references; the two requests run concurrently
     refs = seed.get("referenced_works", []) or []
-    for wid in refs[:25]:
-        try:
-            w = http_get_json(
-                wid, timeout_seconds=30, source_name="openalex", min_interval_seconds=0.2
-            )
-            doi_val = w.get("doi")
-            if isinstance(doi_val, str) and doi_val:
-                dois.add(doi_val)
-        except Exception:  # noqa: BLE001
-            continue
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        cited_future = ex.submit(_cited_by_dois, seed)
+        refs_future = ex.submit(_reference_dois, refs[:25])
+        dois.update(cited_future.result())
+        dois.update(refs_future.result())
 
     return list(dois)
+
+
+def _dois_from_results(page: dict[str, Any]) -> list[str]:
+    out: list[str] = []
+    for it in page.get("results", [])[:25]:
+        doi_val = it.get("doi")
+        if isinstance(doi_val, str) and doi_val:
+            out.append(doi_val)
+    return out
+
+
+def _cited_by_dois(seed: dict[str, Any]) -> list[str]:
+    """DOIs of works citing the seed (first page, 25 items); best-effort."""
+    # Use the provided API URL when available, otherwise try the {work_id}/cited-by endpoint
+    url = seed.get("cited_by_api_url")
+    if not isinstance(url, str) or not url:
+        wid = seed.get("id")
+        if not isinstance(wid, str) or not wid:
+            return []
+        url = f"{wid}/cited-by"
+    try:
+        cited = http_get_json(
+            url,
+            params={"per_page": "25", "select": "id,doi"},
+            timeout_seconds=30,
+            source_name="openalex",
+            min_interval_seconds=0.5,
+            cache=_cache,
+        )
+    except Exception:  # noqa: BLE001
+        return []
+    return _dois_from_results(cited)
+
+
+def _reference_dois(refs: list[str]) -> list[str]:
+    """Resolve referenced Work IDs to DOIs in a single OR-filtered request; best-effort."""
+    short_ids = [wid.rsplit("/", 1)[-1] for wid in refs if isinstance(wid, str) and wid]
+    if not short_ids:
+        return []
+    try:
+        page = http_get_json(
+            WORKS_URL,
+            params={
+                "filter": "openalex:" + "|".join(short_ids),
+                "per_page": str(len(short_ids)),
+                "select": "id,doi",
+            },
+            timeout_seconds=30,
+            source_name="openalex",
+            min_interval_seconds=0.2,
+            cache=_cache,
+        )
+    except Exception:  # noqa: BLE001
+        return []
+    return _dois_from_results(page)
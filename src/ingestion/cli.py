@@ -1,21 +1,20 @@
 from __future__ import annotations
 
-import json
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
+from importlib import import_module
+from typing import Any
 
 import typer
-import yaml
 from dotenv import load_dotenv
 
 from .citations import fetch_openalex_neighbors
 from .config import Settings
-from .connectors.arxiv import ArxivConnector
 from .connectors.base import PaperMetadata, QuerySpec
-from .connectors.core import COREConnector
-from .connectors.doaj import DOAJConnector
-from .connectors.openalex import OpenAlexConnector
-from .connectors.pmc import PMCConnector
-from .connectors.semanticscholar import SemanticScholarConnector
 from .db import Base, create_session_factory, ensure_schema
+from .dedup import backfill_identity_hashes
 from .ingest import ingest_records
 from .parser import (
     extract_abstract_and_conclusion,
@@ -24,32 +23,183 @@ from .parser import (
 from .parser_grobid import grobid_parse_pdf
 from .storage import ensure_storage_dir
 from .summarizer import extractive_summary, summarize_sections
+from .utils import TokenBucket, dumps_json_line
+
+# Connector (module, class) by --source name. Imported on first use, so commands that never
+# search (reindex, parse-new, ...) skip the client libraries; instantiated once per process.
+_CONNECTORS: dict[str, tuple[str, str]] = {
+    "arxiv": ("arxiv", "ArxivConnector"),
+    "openalex": ("openalex", "OpenAlexConnector"),
+    "semanticscholar": ("semanticscholar", "SemanticScholarConnector"),
+    "doaj": ("doaj", "DOAJConnector"),
+    "core": ("core", "COREConnector"),
+    "pmc": ("pmc", "PMCConnector"),
+}
+
+
+_connector_instances: dict[str, Any] = {}
+
+
+def _make_connector(source: str, default: str = "arxiv"):
+    """Return the shared connector for ``source``; sweeps reuse it across every item."""
+    name = source if source in _CONNECTORS else default
+    connector = _connector_instances.get(name)
+    if connector is None:
+        module, cls = _CONNECTORS[name]
+        connector_cls = getattr(import_module(f".connectors.{module}", __package__), cls)
+        connector = _connector_instances.setdefault(name, connector_cls())
+    return connector
+
+
+# One token bucket per source, shared by every command in the process
+_search_buckets: dict[str, TokenBucket] = {}
+
+
+def _pace_search(connector, settings: Settings) -> None:
+    """Wait for a token before a connector search so sweeps stay under provider limits."""
+    source = getattr(connector, "source_name", "")
+    rate = settings.source_rps.get(source, 0.0)
+    if rate <= 0:
+        return
+    bucket = _search_buckets.get(source)
+    if bucket is None:
+        bucket = _search_buckets.setdefault(source, TokenBucket(rate))
+    bucket.consume()
+
+
+def _echo_json(obj: dict) -> None:
+    """Print ``obj`` as one JSON line (orjson-encoded when installed)."""
+    typer.echo(dumps_json_line(obj), nl=False)
 
 
 def _init_db(session_factory) -> None:
-    # Create tables if not exist
+    # Create tables if not exist, then hash rows stored before identity_hash existed
     with session_factory() as session:
         engine = session.get_bind()
         ensure_schema(Base, engine)
+        backfill_identity_hashes(session)
 
 
-def _normalize_license(raw: str | None) -> str | None:
-    if not raw:
-        return None
-    s = raw.strip().lower()
-    # simple normalization for CC licenses
-    cc_map = {
-        "cc-by": "cc-by",
-        "cc by": "cc-by",
-        "cc-by-sa": "cc-by-sa",
-        "cc by-sa": "cc-by-sa",
-        "cc0": "cc0",
-        "public domain": "public-domain",
-    }
-    for k, v in cc_map.items():
-        if k in s:
-            return v
-    return s
+@lru_cache(maxsize=1)
+def _settings() -> Settings:
+    """Environment (.env included) is read once per process and shared by every command."""
+    load_dotenv()
+    return Settings.from_env()
+
+
+@lru_cache(maxsize=4)
+def _session_factory(database_url: str):
+    """One engine/pool per database URL, with the schema check run only on first use."""
+    session_factory = create_session_factory(database_url)
+    _init_db(session_factory)
+    return session_factory
+
+
+# Rows fetched per round trip by the backfill commands
+_BATCH_SIZE = 500
+
+
+def _iter_paper_batches(
+    session,
+    columns: tuple = (),
+    batch_size: int = _BATCH_SIZE,
+    start_after: int = 0,
+    where: tuple = (),
+):
+    """Yield every Paper in id order as lists of up to ``batch_size`` rows.
+
+    Each batch is its own keyset query (``id > last_id``), so memory stays bounded and the
+    caller may commit between batches without invalidating an open server-side cursor.
+    Commit only after finishing a batch: a commit expires the batch's loaded rows, and each
+    would then be reloaded with its own SELECT.
+    ``columns`` restricts which attributes are loaded (``load_only``); the id always is.
+    ``start_after`` resumes the scan after a previously checkpointed id.
+    ``where`` adds SQL filter criteria, so rows that need no work never leave the database.
+    """
+    from sqlalchemy import select
+    from sqlalchemy.orm import load_only
+
+    from .models import Paper
+
+    last_id = start_after
+    while True:
+        stmt = select(Paper).where(Paper.id > last_id, *where).order_by(Paper.id).limit(batch_size)
+        if columns:
+            stmt = stmt.options(load_only(*columns))
+        batch = session.execute(stmt).scalars().all()
+        if not batch:
+            return
+        last_id = batch[-1].id
+        yield batch
+
+
+def _parse_pdf(pdf_path: str, backend: str, grobid_host: str) -> dict[str, str]:
+    """Parse a PDF with the configured backend, falling back to pdfminer if GROBID fails."""
+    if backend == "grobid":
+        sections = grobid_parse_pdf(pdf_path, host=grobid_host)
+        if sections:
+            return sections
+    return parse_pdf_into_sections(pdf_path)
+
+
+def _parse_pdf_job(job: tuple[str, str, str]) -> tuple[dict[str, str] | None, str | None]:
+    """Pool worker: return ``(sections, None)`` or ``(None, error)`` instead of raising."""
+    try:
+        return _parse_pdf(*job), None
+    except Exception as exc:  # noqa: BLE001
+        return None, str(exc)
+
+
+def _parse_executor(settings: Settings):
+    # pdfminer is CPU-bound (processes sidestep the GIL). GROBID is remote I/O, so threads
+    # suffice, but its local fallback parses in these threads too (PDFium extraction is
+    # serialized by parser._PDFIUM_LOCK)
+    if settings.parser_backend == "grobid":
+        return ThreadPoolExecutor(max_workers=8)
+    return ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+
+
+def _load_checkpoint(path: str | None) -> int:
+    """Last processed paper id recorded in ``path`` (0 when absent or unreadable)."""
+    if not path:
+        return 0
+    try:
+        with open(path, encoding="utf-8") as f:
+            return int(f.read().strip() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def _save_checkpoint(path: str | None, last_id: int) -> None:
+    if not path:
+        return
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(str(last_id))
+    os.replace(tmp, path)
+
+
+def _bulk_update(session, rows: list[dict]) -> None:
+    """Write per-paper column changes as executemany UPDATEs keyed by id, then commit.
+
+    Avoids flushing fully hydrated ORM objects (with their large ``sections`` JSON) row by row.
+    """
+    from sqlalchemy import update
+
+    from .models import Paper
+
+    if rows:
+        session.execute(update(Paper), rows)
+    session.commit()
+
+
+def _sections_nonempty():
+    """SQL predicate for a non-empty ``sections`` JSON object (portable across sqlite/postgres)."""
+    from sqlalchemy import String, cast, func
+
+    from .models import Paper
+
+    return func.coalesce(cast(Paper.sections, String), "{}").notin_(["{}", "null", ""])
 
 
 def main(
@@ -61,32 +211,34 @@ def main(
     ),
 ):
     """Run a search against the selected source, store metadata and PDFs (license permitting)."""
-    load_dotenv()
-    settings = Settings.from_env()
-    # Allow CLI override
-    if max_results:
-        settings.arxiv_max_results = max_results
+    settings, session_factory = _prepare_ingest()
+    res = _run_sweep(settings, session_factory, query, author, max_results, source)
+    _echo_json({"stored": res.stored, "skipped": res.skipped, "errors": res.errors})
 
-    session_factory = create_session_factory(settings.database_url)
-    _init_db(session_factory)
+
+def _prepare_ingest():
+    """One-time setup for ingest commands: env, settings, DB schema and storage dir."""
+    settings = _settings()
+    session_factory = _session_factory(settings.database_url)
     ensure_storage_dir(settings.storage_dir)
+    return settings, session_factory
+
 
-    connector = {
-        "arxiv": ArxivConnector(),
-        "openalex": OpenAlexConnector(),
-        "semanticscholar": SemanticScholarConnector(),
-        "doaj": DOAJConnector(),
-        "core": COREConnector(),
-        "pmc": PMCConnector(),
-    }.get(source, ArxivConnector())
+def _search(settings: Settings, query: str, author: str | None, max_results: int, source: str):
+    """Start a paced search of one source; returns the connector's record iterator."""
+    connector = _make_connector(source)
     spec = QuerySpec(
         keywords=[query] if query else [],
         authors=[author] if author else [],
-        max_results=settings.arxiv_max_results,
+        # CLI/sweep value overrides ARXIV_MAX_RESULTS
+        max_results=max_results or settings.arxiv_max_results,
     )
-    records = connector.search(spec)
+    _pace_search(connector, settings)
+    return connector.search(spec)
 
-    res = ingest_records(
+
+def _ingest(settings: Settings, session_factory, records):
+    return ingest_records(
         records,
         session_factory=session_factory,
         storage_dir=settings.storage_dir,
@@ -94,7 +246,18 @@ def main(
         rate_limit_delay_seconds=settings.rate_limit_delay_seconds,
     )
 
-    typer.echo(json.dumps({"stored": res.stored, "skipped": res.skipped, "errors": res.errors}))
+
+def _run_sweep(
+    settings: Settings,
+    session_factory,
+    query: str,
+    author: str | None,
+    max_results: int,
+    source: str,
+):
+    """Search one source and ingest the results using already prepared settings and DB."""
+    records = _search(settings, query, author, max_results, source)
+    return _ingest(settings, session_factory, records)
 
 
 app = typer.Typer(add_completion=False)
@@ -112,6 +275,71 @@ def cmd_run(
     main(query=query, author=author, max_results=max_results, source=source)
 
 
+# Concurrent neighbor lookups per level; the per-source rate limiter still spaces requests
+_EXPAND_WORKERS = 8
+
+
+def _fetch_neighbors(doi: str, max_per_level: int) -> list[str]:
+    try:
+        return fetch_openalex_neighbors(doi)[:max_per_level]
+    except Exception as exc:  # noqa: BLE001
+        typer.secho(f"citation fetch failed for {doi}: {exc}", fg=typer.colors.RED)
+        return []
+
+
+def _expand_frontier(frontier: list[str], max_per_level: int) -> list[list[str]]:
+    """Fetch neighbors for every DOI in the frontier concurrently, preserving frontier order."""
+    if len(frontier) <= 1:
+        return [_fetch_neighbors(doi, max_per_level) for doi in frontier]
+    with ThreadPoolExecutor(max_workers=min(_EXPAND_WORKERS, len(frontier))) as ex:
+        return list(ex.map(lambda doi: _fetch_neighbors(doi, max_per_level), frontier))
+
+
+def _known_dois(session_factory, dois: list[str]) -> set[str]:
+    """Subset of ``dois`` already in the papers table, as given or without the doi.org prefix."""
+    from sqlalchemy import select
+
+    from .models import Paper
+
+    def _bare(doi: str) -> str:
+        return doi.removeprefix("https://doi.org/")
+
+    stored: set[str] = set()
+    with session_factory() as session:
+        for start in range(0, len(dois), _BATCH_SIZE):
+            chunk = dois[start : start + _BATCH_SIZE]
+            candidates = set(chunk) | {_bare(d) for d in chunk}
+            stored.update(
+                session.execute(select(Paper.doi).where(Paper.doi.in_(candidates))).scalars()
+            )
+    return {d for d in dois if d in stored or _bare(d) in stored}
+
+
+def _search_dois(connector, dois: list[str], settings: Settings) -> list[PaperMetadata]:
+    """Resolve DOIs to metadata, batched when the connector supports it (OpenAlex)."""
+    if not dois:
+        return []
+    if hasattr(connector, "search_by_dois"):
+        try:
+            _pace_search(connector, settings)
+            return list(connector.search_by_dois(dois))
+        except Exception as exc:  # noqa: BLE001
+            typer.secho(f"batched DOI lookup failed: {exc}", fg=typer.colors.RED)
+            return []
+
+    def _lookup(doi: str) -> list[PaperMetadata]:
+        try:
+            _pace_search(connector, settings)
+            return list(connector.search(QuerySpec(keywords=[doi], max_results=1)))
+        except Exception as exc:  # noqa: BLE001
+            typer.secho(f"lookup failed for {doi}: {exc}", fg=typer.colors.RED)
+            return []
+
+    # One lookup per DOI: overlap their latency, still paced by the source's token bucket
+    with ThreadPoolExecutor(max_workers=min(_EXPAND_WORKERS, len(dois))) as ex:
+        return [rec for found in ex.map(_lookup, dois) for rec in found]
+
+
 @app.command("hydrate-citations")
 def cmd_hydrate_citations(
     seed_doi: str = typer.Argument(..., help="Seed DOI to expand"),
@@ -127,10 +355,8 @@ def cmd_hydrate_citations(
     ),
 ):
     """Fetch citation neighbors via OpenAlex and enqueue ingestion for discovered DOIs."""
-    load_dotenv()
-    settings = Settings.from_env()
-    session_factory = create_session_factory(settings.database_url)
-    _init_db(session_factory)
+    settings = _settings()
+    session_factory = _session_factory(settings.database_url)
     ensure_storage_dir(settings.storage_dir)
 
     # Offline mode: ingest from file of DOIs directly (deterministic demonstration)
@@ -142,9 +368,11 @@ def cmd_hydrate_citations(
             typer.secho(f"failed to read neighbors file: {exc}", fg=typer.colors.RED)
             raise typer.Exit(code=2) from None
 
-        count = 0
-        for i, doi in enumerate(lines[: max_per_level * depth]):
-            pm = PaperMetadata(
+        lines = lines[: max_per_level * depth]
+        # DOIs already stored would only be rejected as duplicates inside ingest_records
+        known = _known_dois(session_factory, lines)
+        batch = [
+            PaperMetadata(
                 source="offline",
                 external_id=f"offline-{i}",
                 doi=doi,
@@ -158,50 +386,52 @@ def cmd_hydrate_citations(
                 concepts=["demo"],
                 citation_count=0,
             )
-            ingest_records(
-                [pm],
-                session_factory=session_factory,
-                storage_dir=settings.storage_dir,
-                request_timeout_seconds=settings.request_timeout_seconds,
-                rate_limit_delay_seconds=settings.rate_limit_delay_seconds,
-            )
-            count += 1
-        typer.echo(json.dumps({"ingested_offline": count}))
+            for i, doi in enumerate(lines)
+            if doi not in known
+        ]
+        # One ingest call (one session) for the whole file
+        res = ingest_records(
+            batch,
+            session_factory=session_factory,
+            storage_dir=settings.storage_dir,
+            request_timeout_seconds=settings.request_timeout_seconds,
+            rate_limit_delay_seconds=settings.rate_limit_delay_seconds,
+        )
+        # DOIs filtered out as already stored count as skipped, like ingest_records' own dedup
+        _echo_json(
+            {
+                "ingested_offline": res.stored,
+                "skipped": res.skipped + len(lines) - len(batch),
+                "errors": res.errors,
+            }
+        )
         return
 
-    # Live mode: expand via provider
+    # Live mode: expand via provider, ingesting every neighbor through one connector
+    connector = _make_connector(source, default="openalex")
     frontier = [seed_doi]
     seen = set(frontier)
     for _ in range(depth):
-        next_level: list[str] = []
-        for doi in frontier:
-            try:
-                neighbors = fetch_openalex_neighbors(doi)[:max_per_level]
-            except Exception as exc:  # noqa: BLE001
-                typer.secho(f"citation fetch failed for {doi}: {exc}", fg=typer.colors.RED)
-                neighbors = []
+        # Unique DOIs first reached at this level, across all parents (overlaps are common)
+        level_dois: list[str] = []
+        for neighbors in _expand_frontier(frontier, max_per_level):
             for ndoi in neighbors:
-                if ndoi in seen:
-                    continue
-                seen.add(ndoi)
-                connector = {
-                    "arxiv": ArxivConnector(),
-                    "openalex": OpenAlexConnector(),
-                    "semanticscholar": SemanticScholarConnector(),
-                    "doaj": DOAJConnector(),
-                    "core": COREConnector(),
-                    "pmc": PMCConnector(),
-                }.get(source, OpenAlexConnector())
-                spec = QuerySpec(keywords=[ndoi], max_results=1)
-                ingest_records(
-                    connector.search(spec),
-                    session_factory=session_factory,
-                    storage_dir=settings.storage_dir,
-                    request_timeout_seconds=settings.request_timeout_seconds,
-                    rate_limit_delay_seconds=settings.rate_limit_delay_seconds,
-                )
-            next_level.extend(neighbors)
-        frontier = next_level
+                if ndoi not in seen:
+                    seen.add(ndoi)
+                    level_dois.append(ndoi)
+        # Skip DOIs already stored, then resolve and ingest the rest of the level at once
+        known = _known_dois(session_factory, level_dois)
+        records = _search_dois(connector, [d for d in level_dois if d not in known], settings)
+        if records:
+            ingest_records(
+                records,
+                session_factory=session_factory,
+                storage_dir=settings.storage_dir,
+                request_timeout_seconds=settings.request_timeout_seconds,
+                rate_limit_delay_seconds=settings.rate_limit_delay_seconds,
+            )
+        # Expand each DOI once: parents already expanded or queued are not fetched again
+        frontier = level_dois
 
 
 @app.command("reindex")
@@ -223,12 +453,59 @@ def cmd_sweep_file(
         max_results: 10
         author: "J. Smith"
     """
-    load_dotenv()
+    items = _load_sweeps(file)
+    settings, session_factory = _prepare_ingest()
+    _run_sweeps(items, settings, session_factory)
+
+
+# Parsed sweep files keyed by path -> (mtime_ns, size, items); the daemon re-reads every loop
+_sweeps_cache: dict[str, tuple[int, int, list]] = {}
+
+
+def _load_sweeps(file: str) -> list:
+    """Load a sweeps YAML list, reusing the parsed result while the file is unchanged."""
+    st = os.stat(file)
+    cached = _sweeps_cache.get(file)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    import yaml
+
     with open(file, encoding="utf-8") as f:
-        items = yaml.safe_load(f) or []
+        # LibYAML-backed loader when PyYAML was built with it; same safe semantics, parsed in C
+        items = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or []
     if not isinstance(items, list):
         typer.secho("sweeps file must be a list", fg=typer.colors.RED)
         raise typer.Exit(code=2)
+    _sweeps_cache[file] = (st.st_mtime_ns, st.st_size, items)
+    return items
+
+
+def _prefetch_searches(jobs: list[tuple], settings: Settings, ex: ThreadPoolExecutor) -> list:
+    """Run each job's search on ``ex``, one chain per source, returning a Future per job.
+
+    A source's searches run back to back in job order (one client at a time per provider);
+    different sources overlap, so a sweep file waits on the slowest source, not the sum.
+    """
+    futures: list[Future] = [Future() for _ in jobs]
+    by_source: dict[str, list[int]] = {}
+    for i, job in enumerate(jobs):
+        by_source.setdefault(job[5], []).append(i)
+
+    def _chain(indexes: list[int]) -> None:
+        for i in indexes:
+            _, _, q, author, max_results, source = jobs[i]
+            try:
+                futures[i].set_result(list(_search(settings, q, author, max_results, source)))
+            except Exception as exc:  # noqa: BLE001 - re-raised when the job is ingested
+                futures[i].set_exception(exc)
+
+    for indexes in by_source.values():
+        ex.submit(_chain, indexes)
+    return futures
+
+
+def _run_sweeps(items: list, settings: Settings, session_factory) -> None:
+    jobs: list[tuple] = []
     for idx, item in enumerate(items, start=1):
         q = (item or {}).get("query")
         if not q:
@@ -237,10 +514,20 @@ def cmd_sweep_file(
         author = (item or {}).get("author")
         source = (item or {}).get("source", "openalex")
         max_results = int((item or {}).get("max_results", 10))
-        typer.echo(
-            f"[sweep {idx}] source={source} query=\"{q}\" author={author or ''} max={max_results}"
-        )
-        main(query=q, author=author, max_results=max_results, source=source)
+        jobs.append((idx, item, q, author, max_results, source))
+    if not jobs:
+        return
+    sources = {job[5] for job in jobs}
+    with ThreadPoolExecutor(max_workers=min(len(sources), _EXPAND_WORKERS)) as ex:
+        searches = _prefetch_searches(jobs, settings, ex)
+        # Ingest in file order on this thread while later searches are still in flight
+        for (idx, _, q, author, max_results, source), search in zip(jobs, searches, strict=True):
+            typer.echo(
+                f'[sweep {idx}] source={source} query="{q}" '
+                f"author={author or ''} max={max_results}"
+            )
+            res = _ingest(settings, session_factory, search.result())
+            _echo_json({"stored": res.stored, "skipped": res.skipped, "errors": res.errors})
 
 
 @app.command("sweep-daemon")
@@ -257,6 +544,8 @@ def cmd_sweep_daemon(
     """
     import time
 
+    # Settings, engine, schema check and storage dir are prepared once for the daemon's lifetime
+    settings, session_factory = _prepare_ingest()
     typer.echo(f"Starting sweep daemon: file={file} interval={interval_seconds}s")
     loops = 0
     try:
@@ -264,7 +553,7 @@ def cmd_sweep_daemon(
             loops += 1
             typer.echo(f"[sweep-daemon] loop={loops}")
             try:
-                cmd_sweep_file(file)
+                _run_sweeps(_load_sweeps(file), settings, session_factory)
             except Exception as exc:  # noqa: BLE001
                 typer.secho(f"sweep run failed: {exc}", fg=typer.colors.RED)
 
@@ -279,71 +568,76 @@ def cmd_sweep_daemon(
 @app.command("parse-new")
 def cmd_parse_new():
     """Parse any papers with stored PDFs that lack parsed sections and store sections + abstract/conclusion."""
-    load_dotenv()
-    settings = Settings.from_env()
-    session_factory = create_session_factory(settings.database_url)
-    _init_db(session_factory)
-    from sqlalchemy import select
-
+    settings = _settings()
+    session_factory = _session_factory(settings.database_url)
     from .models import Paper
 
     updated = 0
     with session_factory() as session:
-        for (paper,) in session.execute(select(Paper)):
-            if not paper.pdf_path or (paper.sections and len(paper.sections) > 0):
-                continue
-            try:
-                paper.parse_attempts = (paper.parse_attempts or 0) + 1
-                if settings.parser_backend == "grobid":
-                    sections = grobid_parse_pdf(paper.pdf_path, host=settings.grobid_host)
-                    if not sections:
-                        # fallback to pdfminer if grobid failed
-                        sections = parse_pdf_into_sections(paper.pdf_path)
-                else:
-                    sections = parse_pdf_into_sections(paper.pdf_path)
-            except Exception as exc:  # noqa: BLE001
-                paper.parse_error = str(exc)[:1000]
-                session.add(paper)
+        columns = (Paper.pdf_path, Paper.abstract, Paper.parse_attempts)
+        unparsed = (Paper.pdf_path.isnot(None), ~_sections_nonempty())
+        with _parse_executor(settings) as ex:
+            for batch in _iter_paper_batches(session, columns, where=unparsed):
+                # Parse the batch in the pool (GROBID requests overlap, pdfminer uses every
+                # core); results are applied on this thread, which owns the session
+                jobs = [(p.pdf_path, settings.parser_backend, settings.grobid_host) for p in batch]
+                results = ex.map(_parse_pdf_job, jobs, chunksize=4)
+                for paper, (sections, error) in zip(batch, results, strict=True):
+                    paper.parse_attempts = (paper.parse_attempts or 0) + 1
+                    if error is not None:
+                        paper.parse_error = error[:1000]
+                        typer.secho(
+                            f"parse failed for paper id={paper.id}: {error}", fg=typer.colors.RED
+                        )
+                        continue
+                    paper.sections = sections or {}
+                    abstract, conclusion = extract_abstract_and_conclusion(paper.sections)
+                    if abstract and not paper.abstract:
+                        paper.abstract = abstract
+                    paper.conclusion = conclusion
+                    updated += 1
+                # One commit per batch, once its rows are no longer read
                 session.commit()
-                typer.secho(f"parse failed for paper id={paper.id}: {exc}", fg=typer.colors.RED)
-                continue
-            paper.sections = sections or {}
-            abstract, conclusion = extract_abstract_and_conclusion(paper.sections)
-            if abstract and not paper.abstract:
-                paper.abstract = abstract
-            paper.conclusion = conclusion
-            session.add(paper)
-            session.commit()
-            updated += 1
-    typer.echo(json.dumps({"parsed": updated}))
+    _echo_json({"parsed": updated})
 
 
 @app.command("summarize-new")
 def cmd_summarize_new():
     """Generate summaries for papers that have parsed sections but no summary yet."""
-    load_dotenv()
-    settings = Settings.from_env()
-    session_factory = create_session_factory(settings.database_url)
-    _init_db(session_factory)
-    from sqlalchemy import select
-
+    settings = _settings()
+    session_factory = _session_factory(settings.database_url)
     from .models import Paper
 
     updated = 0
     with session_factory() as session:
-        for (paper,) in session.execute(select(Paper)):
-            if paper.summary:
-                continue
-            summary: str | None = None
-            if paper.sections:
-                summary = summarize_sections(paper.sections)
-            elif paper.abstract:
-                summary = extractive_summary(paper.abstract, max_sentences=5, max_chars=1000)
-            paper.summary = summary[:1000] if summary else None
-            session.add(paper)
+        columns = (Paper.sections, Paper.abstract, Paper.summary)
+        for batch in _iter_paper_batches(session, columns):
+            for paper in batch:
+                if paper.summary:
+                    continue
+                summary: str | None = None
+                if paper.sections:
+                    summary = summarize_sections(paper.sections)
+                elif paper.abstract:
+                    summary = extractive_summary(paper.abstract, max_sentences=5, max_chars=1000)
+                paper.summary = summary[:1000] if summary else None
+                updated += 1
+            # One commit per batch, once its rows are no longer read
             session.commit()
-            updated += 1
-    typer.echo(json.dumps({"summarized": updated}))
+    _echo_json({"summarized": updated})
+
+
+def _backup_snapshot(paper) -> dict:
+    """Mutable retro-parse fields of ``paper``, as written to the ``--backup-file`` JSONL."""
+    return {
+        "id": paper.id,
+        "sections": paper.sections or {},
+        "abstract": paper.abstract,
+        "conclusion": paper.conclusion,
+        "summary": paper.summary,
+        "parse_attempts": int(paper.parse_attempts or 0),
+        "parse_error": paper.parse_error,
+    }
 
 
 @app.command("retro-parse")
@@ -351,55 +645,71 @@ def cmd_retro_parse(
     backup_file: str | None = typer.Option(
         None,
         "--backup-file",
-        help="Optional path to write JSONL backup of fields that may be modified (id, sections, abstract, conclusion, summary, parse_attempts, parse_error)",
+        help="Optional path to write JSONL backup of fields that may be modified (id, sections, abstract, conclusion, summary, parse_attempts, parse_error); appended to when resuming from --checkpoint-file",
     ),
     dry_run: bool = typer.Option(
         False,
         "--dry-run",
         help="Do not modify the database; report counts of items that would be parsed/summarized",
     ),
+    checkpoint_file: str | None = typer.Option(
+        None,
+        "--checkpoint-file",
+        help="Optional path recording the last committed paper id; an interrupted run resumes after it",
+    ),
 ):
     """Backfill: parse sections and generate summaries for all existing PDFs, overwriting empty fields only.
 
     Safety:
       - Use --backup-file to write a JSONL snapshot of mutable fields prior to changes.
       - Use --dry-run to audit what would change without modifying data.
+      - Use --checkpoint-file to make an interrupted backfill resumable; delete it to start over.
+        A resumed run appends to --backup-file, so the first run's snapshots are kept.
     """
-    load_dotenv()
-    settings = Settings.from_env()
-    session_factory = create_session_factory(settings.database_url)
-    _init_db(session_factory)
+    settings = _settings()
+    session_factory = _session_factory(settings.database_url)
     from sqlalchemy import select
+    from sqlalchemy.orm import load_only
 
     from .models import Paper
 
     parsed = 0
     summarized = 0
-    with session_factory() as session:
-        # Optional backup of mutable fields before any modification
+    start_after = _load_checkpoint(checkpoint_file)
+    with session_factory() as session, ExitStack() as stack:
+        # Optional backup of mutable fields, written in the same pass as the audit/apply below:
+        # each row's snapshot is written before any change to it is flushed
+        bf = None
         if backup_file:
+            # Resuming: earlier rows were already changed, their only snapshots are in the file
+            mode = "ab" if start_after > 0 else "wb"
             try:
-                with open(backup_file, "w", encoding="utf-8") as bf:
-                    for (paper,) in session.execute(select(Paper)):
-                        snapshot = {
-                            "id": paper.id,
-                            "sections": paper.sections or {},
-                            "abstract": paper.abstract,
-                            "conclusion": paper.conclusion,
-                            "summary": paper.summary,
-                            "parse_attempts": int(paper.parse_attempts or 0),
-                            "parse_error": paper.parse_error,
-                        }
-                        bf.write(json.dumps(snapshot) + "\n")
-                typer.secho(f"backup written: {backup_file}", fg=typer.colors.GREEN)
+                # Binary writer with a large buffer: rows are pre-encoded JSON lines
+                bf = stack.enter_context(open(backup_file, mode, buffering=1024 * 1024))
             except Exception as exc:  # noqa: BLE001
                 typer.secho(f"failed to write backup file: {exc}", fg=typer.colors.RED)
                 raise typer.Exit(code=2) from None
+        backup_columns = (
+            Paper.sections,
+            Paper.abstract,
+            Paper.conclusion,
+            Paper.summary,
+            Paper.parse_attempts,
+            Paper.parse_error,
+        )
 
         if dry_run:
             would_parse = 0
             would_summarize = 0
-            for (paper,) in session.execute(select(Paper)):
+            audit_columns = (
+                backup_columns if bf else (Paper.sections, Paper.abstract, Paper.summary)
+            )
+            audit_stmt = select(Paper).options(load_only(Paper.pdf_path, *audit_columns))
+            for paper in session.execute(
+                audit_stmt.execution_options(yield_per=_BATCH_SIZE)
+            ).scalars():
+                if bf:
+                    bf.write(dumps_json_line(_backup_snapshot(paper)))
                 if paper.pdf_path and not paper.sections:
                     would_parse += 1
                 if (paper.sections and not paper.summary) or (
@@ -407,96 +717,126 @@ def cmd_retro_parse(
                 ):
                     # Either will summarize from sections once parsed, or from abstract if sections remain unavailable
                     would_summarize += 1
-            typer.echo(
-                json.dumps(
-                    {
-                        "dry_run": True,
-                        "would_parse": would_parse,
-                        "would_summarize": would_summarize,
-                    }
-                )
+            if bf:
+                typer.secho(f"backup written: {backup_file}", fg=typer.colors.GREEN)
+            _echo_json(
+                {
+                    "dry_run": True,
+                    "would_parse": would_parse,
+                    "would_summarize": would_summarize,
+                }
             )
             return
 
-        for (paper,) in session.execute(select(Paper)):
-            if not paper.pdf_path:
-                continue
-            if not paper.sections:
-                try:
-                    paper.parse_attempts = (paper.parse_attempts or 0) + 1
-                    if settings.parser_backend == "grobid":
-                        sections = grobid_parse_pdf(paper.pdf_path, host=settings.grobid_host)
-                        if not sections:
-                            sections = parse_pdf_into_sections(paper.pdf_path)
-                    else:
-                        sections = parse_pdf_into_sections(paper.pdf_path)
-                except Exception as exc:  # noqa: BLE001
-                    paper.parse_error = str(exc)[:1000]
-                    session.add(paper)
-                    session.commit()
-                    typer.secho(
-                        f"retro-parse failed for paper id={paper.id}: {exc}", fg=typer.colors.RED
+        with _parse_executor(settings) as ex:
+            columns = (Paper.pdf_path, *backup_columns)
+            for batch in _iter_paper_batches(session, columns, start_after=start_after):
+                batch_last_id = batch[-1].id
+                if bf:
+                    for paper in batch:
+                        bf.write(dumps_json_line(_backup_snapshot(paper)))
+                    # On disk before the batch's updates are committed
+                    bf.flush()
+                # Parse the batch's unparsed PDFs in the pool; apply results on this thread,
+                # which owns the session
+                to_parse = [p for p in batch if p.pdf_path and not p.sections]
+                jobs = [
+                    (p.pdf_path, settings.parser_backend, settings.grobid_host) for p in to_parse
+                ]
+                results = dict(
+                    zip(
+                        [p.id for p in to_parse],
+                        ex.map(_parse_pdf_job, jobs, chunksize=4),
+                        strict=True,
                     )
-                    continue
-                paper.sections = sections or {}
-                abstract, conclusion = extract_abstract_and_conclusion(paper.sections)
-                if abstract and not paper.abstract:
-                    paper.abstract = abstract
-                if conclusion and not paper.conclusion:
-                    paper.conclusion = conclusion
-                parsed += 1
-            if paper.sections and not paper.summary:
-                summary = summarize_sections(paper.sections)
-                paper.summary = summary[:1000] if summary else None
-                summarized += 1
-            session.add(paper)
-            session.commit()
-    typer.echo(json.dumps({"parsed": parsed, "summarized": summarized}))
+                )
+                updates: list[dict] = []
+                for paper in batch:
+                    if not paper.pdf_path:
+                        continue
+                    row: dict = {"id": paper.id}
+                    sections = paper.sections
+                    if paper.id in results:
+                        row["parse_attempts"] = (paper.parse_attempts or 0) + 1
+                        parsed_sections, error = results[paper.id]
+                        if error is not None:
+                            row["parse_error"] = error[:1000]
+                            updates.append(row)
+                            typer.secho(
+                                f"retro-parse failed for paper id={paper.id}: {error}",
+                                fg=typer.colors.RED,
+                            )
+                            continue
+                        sections = row["sections"] = parsed_sections or {}
+                        abstract, conclusion = extract_abstract_and_conclusion(sections)
+                        if abstract and not paper.abstract:
+                            row["abstract"] = abstract
+                        if conclusion and not paper.conclusion:
+                            row["conclusion"] = conclusion
+                        parsed += 1
+                    if sections and not paper.summary:
+                        summary = summarize_sections(sections)
+                        row["summary"] = summary[:1000] if summary else None
+                        summarized += 1
+                    if len(row) > 1:
+                        updates.append(row)
+                _bulk_update(session, updates)
+                # Committed: a rerun with the same checkpoint file picks up after this batch
+                _save_checkpoint(checkpoint_file, batch_last_id)
+    if bf:
+        typer.secho(f"backup written: {backup_file}", fg=typer.colors.GREEN)
+    _echo_json({"parsed": parsed, "summarized": summarized})
 
 
 @app.command("retry-parses")
 def cmd_retry_parses(max_retries: int = typer.Option(3, "--max-retries")):
     """Retry parsing for papers with previous parse errors and attempts < max."""
-    load_dotenv()
-    settings = Settings.from_env()
-    session_factory = create_session_factory(settings.database_url)
-    _init_db(session_factory)
-    from sqlalchemy import select
+    settings = _settings()
+    session_factory = _session_factory(settings.database_url)
+    from sqlalchemy import func, or_
 
     from .models import Paper
 
     retried = 0
     with session_factory() as session:
-        for (paper,) in session.execute(select(Paper)):
-            attempts = int(paper.parse_attempts or 0)
-            if not paper.pdf_path or (paper.sections and len(paper.sections) > 0):
-                continue
-            if attempts >= max_retries and paper.parse_error:
-                continue
-            try:
-                paper.parse_attempts = attempts + 1
-                if settings.parser_backend == "grobid":
-                    sections = grobid_parse_pdf(paper.pdf_path, host=settings.grobid_host)
-                    if not sections:
-                        sections = parse_pdf_into_sections(paper.pdf_path)
-                else:
-                    sections = parse_pdf_into_sections(paper.pdf_path)
-                paper.sections = sections or {}
-                abstract, conclusion = extract_abstract_and_conclusion(paper.sections)
-                if abstract and not paper.abstract:
-                    paper.abstract = abstract
-                if conclusion and not paper.conclusion:
-                    paper.conclusion = conclusion
-                paper.parse_error = None
-                session.add(paper)
-                session.commit()
-                retried += 1
-            except Exception as exc:  # noqa: BLE001
-                paper.parse_error = str(exc)[:1000]
-                session.add(paper)
-                session.commit()
-                continue
-    typer.echo(json.dumps({"retried": retried}))
+        columns = (
+            Paper.pdf_path,
+            Paper.abstract,
+            Paper.conclusion,
+            Paper.parse_attempts,
+            Paper.parse_error,
+        )
+        retryable = (
+            Paper.pdf_path.isnot(None),
+            ~_sections_nonempty(),
+            or_(
+                func.coalesce(Paper.parse_attempts, 0) < max_retries,
+                func.coalesce(Paper.parse_error, "") == "",
+            ),
+        )
+        with _parse_executor(settings) as ex:
+            for batch in _iter_paper_batches(session, columns, where=retryable):
+                jobs = [(p.pdf_path, settings.parser_backend, settings.grobid_host) for p in batch]
+                results = ex.map(_parse_pdf_job, jobs, chunksize=4)
+                updates: list[dict] = []
+                for paper, (sections, error) in zip(batch, results, strict=True):
+                    attempts = int(paper.parse_attempts or 0)
+                    row: dict = {"id": paper.id, "parse_attempts": attempts + 1}
+                    if error is not None:
+                        row["parse_error"] = error[:1000]
+                        updates.append(row)
+                        continue
+                    row["sections"] = sections or {}
+                    abstract, conclusion = extract_abstract_and_conclusion(row["sections"])
+                    if abstract and not paper.abstract:
+                        row["abstract"] = abstract
+                    if conclusion and not paper.conclusion:
+                        row["conclusion"] = conclusion
+                    row["parse_error"] = None
+                    updates.append(row)
+                    retried += 1
+                _bulk_update(session, updates)
+    _echo_json({"retried": retried})
 
 
 @app.command("coverage-counts")
@@ -509,43 +849,42 @@ def cmd_coverage_counts():
     - with_abstract_and_conclusion: papers with both abstract and conclusion
     - with_summary: papers with a summary
     """
-    from sqlalchemy import select
+    from sqlalchemy import case, func, select
 
     from .models import Paper
 
-    load_dotenv()
-    settings = Settings.from_env()
-    session_factory = create_session_factory(settings.database_url)
-    _init_db(session_factory)
+    settings = _settings()
+    session_factory = _session_factory(settings.database_url)
+
+    def _count_where(cond):
+        # NULL comparisons fall through to 0, matching the Python truthiness checks
+        return func.coalesce(func.sum(case((cond, 1), else_=0)), 0)
+
+    def _non_blank(col):
+        # Drop newlines/tabs before trimming, so whitespace-only text counts as blank like str.strip()
+        for ch in ("\n", "\r", "\t"):
+            col = func.replace(col, ch, "")
+        return func.trim(col) != ""
 
     with session_factory() as session:
-        with_pdf = 0
-        with_sections = 0
-        with_abs_concl = 0
-        with_summary = 0
-        total = 0
-        for (paper,) in session.execute(select(Paper)):
-            total += 1
-            if paper.pdf_path:
-                with_pdf += 1
-            if paper.sections and len(paper.sections) > 0:
-                with_sections += 1
-            if (paper.abstract and paper.abstract.strip()) and (
-                paper.conclusion and paper.conclusion.strip()
-            ):
-                with_abs_concl += 1
-            if paper.summary and paper.summary.strip():
-                with_summary += 1
-    typer.echo(
-        json.dumps(
-            {
-                "total": total,
-                "with_pdf": with_pdf,
-                "with_sections": with_sections,
-                "with_abstract_and_conclusion": with_abs_concl,
-                "with_summary": with_summary,
-            }
-        )
+        # One aggregate scan in the database instead of hydrating every row
+        total, with_pdf, with_sections, with_abs_concl, with_summary = session.execute(
+            select(
+                func.count(),
+                _count_where(Paper.pdf_path != ""),
+                _count_where(_sections_nonempty()),
+                _count_where(_non_blank(Paper.abstract) & _non_blank(Paper.conclusion)),
+                _count_where(_non_blank(Paper.summary)),
+            ).select_from(Paper)
+        ).one()
+    _echo_json(
+        {
+            "total": total,
+            "with_pdf": with_pdf,
+            "with_sections": with_sections,
+            "with_abstract_and_conclusion": with_abs_concl,
+            "with_summary": with_summary,
+        }
     )
 
 
@@ -564,10 +903,8 @@ def cmd_ingest_pdf(
 
     This is a convenience utility for demos and UI testing.
     """
-    load_dotenv()
-    settings = Settings.from_env()
-    session_factory = create_session_factory(settings.database_url)
-    _init_db(session_factory)
+    settings = _settings()
+    session_factory = _session_factory(settings.database_url)
     ensure_storage_dir(settings.storage_dir)
 
     from .storage import download_pdf_to_storage
@@ -596,15 +933,18 @@ def cmd_ingest_pdf(
         else (extractive_summary(abstract or "") if abstract else "")
     )
 
+    from .dedup import identity_hash
     from .models import Paper
 
+    author_list = [a.strip() for a in authors.split(",") if a.strip()]
     with session_factory() as session:
         paper = Paper(
             source=source,
             external_id=None,
             doi=None,
             title=title,
-            authors={"list": [a.strip() for a in authors.split(",") if a.strip()]},
+            identity_hash=identity_hash(title, author_list),
+            authors={"list": author_list},
             abstract=abstract,
             license=license,
             pdf_path=pdf_path,
@@ -618,7 +958,7 @@ def cmd_ingest_pdf(
         )
         session.add(paper)
         session.commit()
-        typer.echo(json.dumps({"ingested_id": paper.id, "has_sections": bool(sections)}))
+        _echo_json({"ingested_id": paper.id, "has_sections": bool(sections)})
 
 
 @app.command("seed-demo-ui")
@@ -630,12 +970,11 @@ def cmd_seed_demo_ui():
     """
     from sqlalchemy import select
 
+    from .dedup import identity_hash
     from .models import Paper
 
-    load_dotenv()
-    settings = Settings.from_env()
-    session_factory = create_session_factory(settings.database_url)
-    _init_db(session_factory)
+    settings = _settings()
+    session_factory = _session_factory(settings.database_url)
 
     demo = {
         "title": "A Demo Transformer Study: Methods, Results and Conclusion",
@@ -666,6 +1005,7 @@ def cmd_seed_demo_ui():
                 external_id="demo-1",
                 doi=None,
                 title=demo["title"],
+                identity_hash=identity_hash(demo["title"], demo["authors"]["list"]),
                 authors=demo["authors"],
                 abstract=demo["abstract"],
                 license=demo["license"],
@@ -684,6 +1024,7 @@ def cmd_seed_demo_ui():
         else:
             # Update fields in case of re-run
             existing.title = demo["title"]
+            existing.identity_hash = identity_hash(demo["title"], demo["authors"]["list"])
             existing.authors = demo["authors"]
             existing.abstract = demo["abstract"]
             existing.license = demo["license"]
@@ -697,7 +1038,7 @@ def cmd_seed_demo_ui():
             session.add(existing)
             session.commit()
             pid = existing.id
-    typer.echo(json.dumps({"seeded_id": pid}))
+    _echo_json({"seeded_id": pid})
 
 
 if __name__ == "__main__":
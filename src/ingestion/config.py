@@ -1,8 +1,29 @@
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+# Default connector.search pacing (requests/second) per source, below each provider's limits
+DEFAULT_SOURCE_RPS: dict[str, float] = {
+    "arxiv": 0.33,
+    "openalex": 10.0,
+    "semanticscholar": 1.0,
+    "doaj": 2.0,
+    "core": 1.0,
+    "pmc": 3.0,
+}
 
-@dataclass
+
+def _parse_source_rps(raw: str | None) -> dict[str, float]:
+    """Parse ``SOURCE_RPS`` overrides such as ``openalex=5,semanticscholar=0.5``."""
+    rates = dict(DEFAULT_SOURCE_RPS)
+    for part in (raw or "").split(","):
+        name, _, value = part.partition("=")
+        if name.strip() and value.strip():
+            rates[name.strip().lower()] = float(value)
+    return rates
+
+
+# Read once per process (see cli._settings) and shared by every command; immutable
+@dataclass(frozen=True, slots=True)
 class Settings:
     database_url: str
     storage_dir: str = "./data/pdfs"
@@ -16,9 +37,12 @@ class Settings:
     weight_citations: float = 0.2
     weight_recency: float = 0.1
     semantic_topk: int = 50
+    semantic_quantize: str = "none"  # none|int8 (CPU dynamic quantization)|fp16 (CUDA only)
     # Parser
     parser_backend: str = "pdfminer"  # pdfminer|grobid
     grobid_host: str = "http://localhost:8070"
+    # Proactive per-source pacing of connector searches (requests/second; 0 disables)
+    source_rps: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_SOURCE_RPS))
 
     @classmethod
     def from_env(cls) -> "Settings":
@@ -36,6 +60,8 @@ class Settings:
             weight_citations=float(os.environ.get("WEIGHT_CITATIONS", "0.2")),
             weight_recency=float(os.environ.get("WEIGHT_RECENCY", "0.1")),
             semantic_topk=int(os.environ.get("SEMANTIC_TOPK", "50")),
+            semantic_quantize=os.environ.get("SEMANTIC_QUANTIZE", "none").lower(),
             parser_backend=os.environ.get("PARSER_BACKEND", "pdfminer"),
             grobid_host=os.environ.get("GROBID_HOST", "http://localhost:8070"),
+            source_rps=_parse_source_rps(os.environ.get("SOURCE_RPS")),
         )
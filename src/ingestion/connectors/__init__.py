@@ -1,6 +1,10 @@
-from .arxiv import ArxivConnector
 from .base import Connector, PaperMetadata, PDFRef, QuerySpec
-from .openalex import OpenAlexConnector
+
+# Implementations pull in their client libraries (e.g. arxiv -> feedparser); import on first access
+_LAZY_EXPORTS = {
+    "ArxivConnector": ".arxiv",
+    "OpenAlexConnector": ".openalex",
+}
 
 __all__ = [
     "Connector",
@@ -10,3 +14,11 @@ __all__ = [
     "ArxivConnector",
     "OpenAlexConnector",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+
+        return getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
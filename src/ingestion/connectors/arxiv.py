@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from functools import lru_cache
 
 import arxiv  # type: ignore
 
+from ..utils import prefetch
 from .base import Connector, PaperMetadata, PDFRef, QuerySpec
 
+_MAX_PAGE_SIZE = 100
+
+
+@lru_cache(maxsize=8)
+def _client(page_size: int) -> arxiv.Client:
+    """Shared client per page size, so arXiv's inter-request delay spans searches."""
+    return arxiv.Client(page_size=page_size)
+
 
 class ArxivConnector(Connector):
     source_name = "arxiv"
@@ -28,7 +38,13 @@ class ArxivConnector(Connector):
             max_results=max_results,
             sort_by=arxiv.SortCriterion.Relevance,
         )
-        for result in search.results():
+        # Request pages no larger than the cap; the client stops after max_results
+        page_size = min(max_results, _MAX_PAGE_SIZE)
+        results = _client(page_size).results(search)
+        if max_results > page_size:
+            # Multi-page: fetch the next page (and sit out arXiv's delay) while this one is used
+            results = prefetch(results, page_size)
+        for result in results:
             authors = [a.name for a in result.authors] if getattr(result, "authors", None) else []
             yield PaperMetadata(
                 source=self.source_name,
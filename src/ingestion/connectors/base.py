@@ -4,7 +4,7 @@ from collections.abc import Iterable
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QuerySpec:
     """Normalized query specification for connectors and search.
 
@@ -25,7 +25,7 @@ class QuerySpec:
     max_results: int = 10
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PDFRef:
     """Reference to a PDF either by URL (remote) and/or local storage path."""
 
@@ -33,7 +33,8 @@ class PDFRef:
     path: str | None = None
 
 
-@dataclass
+# Mutable (ingestion normalizes ``license`` in place); slots keep per-record memory small
+@dataclass(slots=True)
 class PaperMetadata:
     # Core identity
     source: str
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from functools import lru_cache
 from urllib.parse import quote_plus
 
 from ..utils import http_get_json
@@ -8,22 +9,30 @@ from .base import Connector, PaperMetadata, PDFRef, QuerySpec
 
 BASE_URL = "https://doaj.org/api/v2/search/articles/"
 FALLBACK_URL = "https://doaj.org/api/search/articles/"
+# bibjson link types that point at a PDF/full text
+_PDF_LINK_TYPES = frozenset({"application/pdf", "pdf", "fulltext", "full-text"})
+
+
+@lru_cache(maxsize=1024)
+def _query_path(keywords: tuple[str, ...], authors: tuple[str, ...]) -> str:
+    """URL-quoted DOAJ query for the path, cached since sweeps repeat the same queries."""
+    # Build a basic query string. DOAJ uses an Elasticsearch-like q parameter.
+    q_parts: list[str] = []
+    if keywords:
+        q_parts.append(" ".join(keywords))
+    if authors:
+        # simple author tokens; DOAJ full query DSL is richer but this works for MVP
+        q_parts.append(" ".join(authors))
+    return quote_plus(" ".join(q_parts) or "*")
 
 
 class DOAJConnector(Connector):
     source_name = "doaj"
 
     def search(self, query: QuerySpec) -> Iterable[PaperMetadata]:
-        # Build a basic query string. DOAJ uses an Elasticsearch-like q parameter.
-        q_parts: list[str] = []
-        if query.keywords:
-            q_parts.append(" ".join(query.keywords))
-        if query.authors:
-            # simple author tokens; DOAJ full query DSL is richer but this works for MVP
-            q_parts.append(" ".join(query.authors))
-        q = " ".join(q_parts) or "*"
+        quoted = _query_path(tuple(query.keywords or ()), tuple(query.authors or ()))
         # DOAJ expects the query in the path instead of a `q` param
-        path = BASE_URL + quote_plus(q)
+        path = BASE_URL + quoted
         params = {"pageSize": str(query.max_results or 10)}
         try:
             data = http_get_json(
@@ -35,7 +44,7 @@ class DOAJConnector(Connector):
             )
         except Exception:
             # Fallback for older DOAJ deployments
-            fallback_path = FALLBACK_URL + quote_plus(q)
+            fallback_path = FALLBACK_URL + quoted
             data = http_get_json(
                 fallback_path,
                 params=params,
@@ -47,7 +56,11 @@ class DOAJConnector(Connector):
         for item in data.get("results", [])[: query.max_results or 10]:
             bib = item.get("bibjson", {}) or {}
             title = bib.get("title") or ""
-            authors = [a.get("name", "") for a in (bib.get("author") or []) if isinstance(a, dict)]
+            authors = [
+                name
+                for a in (bib.get("author") or [])
+                if isinstance(a, dict) and (name := a.get("name"))
+            ]
             abstract = bib.get("abstract")
             year = None
             try:
@@ -78,22 +91,17 @@ class DOAJConnector(Connector):
             for link in bib.get("link", []) or []:
                 if not isinstance(link, dict):
                     continue
-                if (link.get("type") or "").lower() in {
-                    "application/pdf",
-                    "pdf",
-                    "fulltext",
-                    "full-text",
-                }:
-                    pdf_url = link.get("url")
-                    if pdf_url:
-                        break
+                if (link.get("type") or "").lower() in _PDF_LINK_TYPES and (
+                    pdf_url := link.get("url")
+                ):
+                    break
 
             yield PaperMetadata(
                 source=self.source_name,
                 external_id=item.get("id"),
                 doi=doi,
                 title=title,
-                authors=[a for a in authors if a],
+                authors=authors,
                 abstract=abstract,
                 license=license_str,
                 pdf_url=pdf_url,
@@ -2,11 +2,44 @@ from __future__ import annotations
 
 import re
 from collections.abc import Iterable
+from typing import Any
 
-from ..utils import http_get_json
+from ..utils import TTLCache, http_get_json
 from .base import Connector, PaperMetadata, PDFRef, QuerySpec
 
 BASE_URL = "https://api.openalex.org/works"
+_DOI_RE = re.compile(r"^10\.\S+/\S+")
+# OpenAlex accepts at most 50 values in one OR filter
+_DOI_BATCH_SIZE = 50
+# Server-side projection to the fields _to_metadata reads; full Work records are several KB each
+_WORK_SELECT = (
+    "id,doi,title,display_name,authorships,open_access,concepts,"
+    "publication_year,publication_date,cited_by_count,best_oa_location,primary_location"
+)
+
+
+# DOI lookups repeat within a citation chain; entries expire so long-running processes
+# still pick up new citation counts, OA status and locations
+_doi_cache = TTLCache(maxsize=4096, ttl_seconds=600)
+
+
+def _doi_results(filter_expr: str) -> tuple[dict[str, Any], ...]:
+    """Raw works for a DOI-filtered search, memoized for a few minutes when non-empty."""
+    cached = _doi_cache.get(filter_expr)
+    if cached is not None:
+        return cached
+    data = http_get_json(
+        BASE_URL,
+        params={"search": "", "per_page": "1", "select": _WORK_SELECT, "filter": filter_expr},
+        timeout_seconds=30,
+        source_name=OpenAlexConnector.source_name,
+        min_interval_seconds=0.5,
+    )
+    results = tuple(data.get("results", [])[:1])
+    if results:
+        # Misses are not cached: the work may be indexed by the next lookup
+        _doi_cache.set(filter_expr, results)
+    return results
 
 
 class OpenAlexConnector(Connector):
@@ -16,14 +49,13 @@ class OpenAlexConnector(Connector):
         params: dict[str, str] = {
             "search": " ".join(query.keywords) if query.keywords else "",
             "per_page": str(query.max_results or 10),
+            "select": _WORK_SELECT,
         }
         filters: list[str] = []
         # If a DOI is present in keywords, use a direct DOI filter for precision
-        doi_from_kw = None
-        for kw in query.keywords or []:
-            if isinstance(kw, str) and re.match(r"^10\.\S+/\S+", kw):
-                doi_from_kw = kw
-                break
+        doi_from_kw = next(
+            (kw for kw in query.keywords or () if isinstance(kw, str) and _DOI_RE.match(kw)), None
+        )
         if doi_from_kw:
             filters.append(f"doi:{doi_from_kw}")
             params["per_page"] = "1"
@@ -39,6 +71,12 @@ class OpenAlexConnector(Connector):
         if filters:
             params["filter"] = ",".join(filters)
 
+        if doi_from_kw:
+            # Items are cached raw; PaperMetadata is rebuilt since ingestion mutates it
+            for item in _doi_results(params["filter"]):
+                yield self._to_metadata(item)
+            return
+
         data = http_get_json(
             BASE_URL,
             params=params,
@@ -47,54 +85,77 @@ class OpenAlexConnector(Connector):
             min_interval_seconds=0.5,
         )
         for item in data.get("results", [])[: query.max_results or 10]:
-            doi = item.get("doi")
-            title = item.get("title") or item.get("display_name") or ""
-            authors = [
-                a.get("author", {}).get("display_name", "") for a in item.get("authorships", [])
-            ]
-            abstract = item.get("abstract") or None
-            license_str = None
-            oa_info = item.get("open_access", {})
-            if isinstance(oa_info, dict):
-                license_str = oa_info.get("license")
-            concepts = [c.get("display_name", "") for c in item.get("concepts", [])]
-            # Prefer explicit publication year when present, then try date fields
+            yield self._to_metadata(item)
+
+    def search_by_dois(self, dois: list[str]) -> Iterable[PaperMetadata]:
+        """Resolve many DOIs with OR-filtered requests (``doi:a|b|c``), 50 DOIs per request."""
+        for start in range(0, len(dois), _DOI_BATCH_SIZE):
+            chunk = dois[start : start + _DOI_BATCH_SIZE]
+            data = http_get_json(
+                BASE_URL,
+                params={
+                    "filter": "doi:" + "|".join(chunk),
+                    "per_page": str(len(chunk)),
+                    "select": _WORK_SELECT,
+                },
+                timeout_seconds=30,
+                source_name=self.source_name,
+                min_interval_seconds=0.5,
+            )
+            for item in data.get("results", []):
+                yield self._to_metadata(item)
+
+    def _to_metadata(self, item: dict[str, Any]) -> PaperMetadata:
+        doi = item.get("doi")
+        title = item.get("title") or item.get("display_name") or ""
+        authors = [
+            name
+            for a in item.get("authorships", [])
+            if (name := (a.get("author") or {}).get("display_name"))
+        ]
+        abstract = item.get("abstract") or None
+        license_str = None
+        oa_info = item.get("open_access", {})
+        if isinstance(oa_info, dict):
+            license_str = oa_info.get("license")
+        concepts = [name for c in item.get("concepts", []) if (name := c.get("display_name"))]
+        # Prefer explicit publication year when present, then try date fields
+        year = None
+        try:
+            if item.get("publication_year") is not None:
+                year = int(item["publication_year"])  # type: ignore[arg-type]
+            elif item.get("publication_date"):
+                year = int(str(item["publication_date"])[:4])
+            elif item.get("from_publication_date"):
+                year = int(str(item["from_publication_date"])[:4])
+        except Exception:  # noqa: BLE001
             year = None
-            try:
-                if item.get("publication_year") is not None:
-                    year = int(item["publication_year"])  # type: ignore[arg-type]
-                elif item.get("publication_date"):
-                    year = int(str(item["publication_date"])[:4])
-                elif item.get("from_publication_date"):
-                    year = int(str(item["from_publication_date"])[:4])
-            except Exception:  # noqa: BLE001
-                year = None
-            citation_count = item.get("cited_by_count")
-            external_id = item.get("id")
-
-            # best OA PDF if available
+        citation_count = item.get("cited_by_count")
+        external_id = item.get("id")
+
+        # best OA PDF if available
+        pdf_url = None
+        try:
+            best_oa = item.get("best_oa_location") or {}
+            if isinstance(best_oa, dict):
+                pdf_url = best_oa.get("pdf_url") or best_oa.get("url")
+        except Exception:  # noqa: BLE001
             pdf_url = None
-            try:
-                best_oa = item.get("best_oa_location") or {}
-                if isinstance(best_oa, dict):
-                    pdf_url = best_oa.get("pdf_url") or best_oa.get("url")
-            except Exception:  # noqa: BLE001
-                pdf_url = None
-
-            yield PaperMetadata(
-                source=self.source_name,
-                external_id=external_id,
-                doi=doi,
-                title=title,
-                authors=[a for a in authors if a],
-                abstract=abstract,
-                license=license_str,
-                pdf_url=pdf_url,
-                year=year,
-                venue=(item.get("host_venue", {}) or {}).get("display_name"),
-                concepts=[c for c in concepts if c],
-                citation_count=citation_count,
-            )
+
+        return PaperMetadata(
+            source=self.source_name,
+            external_id=external_id,
+            doi=doi,
+            title=title,
+            authors=authors,
+            abstract=abstract,
+            license=license_str,
+            pdf_url=pdf_url,
+            year=year,
+            venue=((item.get("primary_location") or {}).get("source") or {}).get("display_name"),
+            concepts=concepts,
+            citation_count=citation_count,
+        )
 
     def fetch_pdf(self, item: PaperMetadata) -> PDFRef | None:
         if item.pdf_url:
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 
 from ..utils import http_get_json
 from .base import Connector, PaperMetadata, PDFRef, QuerySpec
 
 EUTILS_SEARCH = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
 EUTILS_SUMMARY = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
+# esummary ids per request (keeps URLs short) and requests in flight
+_SUMMARY_CHUNK = 50
+_SUMMARY_WORKERS = 4
 
 
 class PMCConnector(Connector):
@@ -32,7 +36,17 @@ class PMCConnector(Connector):
             : query.max_results or 10
         ]
         if not idlist:
-            return []
+            return
+        chunks = [idlist[i : i + _SUMMARY_CHUNK] for i in range(0, len(idlist), _SUMMARY_CHUNK)]
+        if len(chunks) == 1:
+            yield from self._summaries(chunks[0])
+            return
+        # Overlap the esummary round trips; http_get_json still spaces their starts per source
+        with ThreadPoolExecutor(max_workers=_SUMMARY_WORKERS) as ex:
+            for records in ex.map(lambda ids: list(self._summaries(ids)), chunks):
+                yield from records
+
+    def _summaries(self, idlist: list[str]) -> Iterable[PaperMetadata]:
         summ_params = {
             "db": "pmc",
             "retmode": "json",
@@ -50,7 +64,9 @@ class PMCConnector(Connector):
             item = result.get(pmcid) or {}
             title = item.get("title") or ""
             authors = [
-                a.get("name", "") for a in (item.get("authors") or []) if isinstance(a, dict)
+                name
+                for a in (item.get("authors") or [])
+                if isinstance(a, dict) and (name := a.get("name"))
             ]
             year = None
             try:
@@ -74,7 +90,7 @@ class PMCConnector(Connector):
                 external_id=pmcid,
                 doi=doi,
                 title=title,
-                authors=[a for a in authors if a],
+                authors=authors,
                 abstract=None,
                 license=item.get("license") or None,
                 pdf_url=pdf_url,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from functools import lru_cache
 
 from ..utils import http_get_json
 from .base import Connector, PaperMetadata, PDFRef, QuerySpec
@@ -8,17 +9,22 @@ from .base import Connector, PaperMetadata, PDFRef, QuerySpec
 BASE_URL = "https://api.semanticscholar.org/graph/v1/paper/search"
 
 
+@lru_cache(maxsize=1024)
+def _query_string(keywords: tuple[str, ...], authors: tuple[str, ...]) -> str:
+    # Build query string; Semantic Scholar supports a simple query parameter
+    q = " ".join(keywords)
+    if authors:
+        q = (q + " " + " ".join(authors)).strip()
+    return q or "*"
+
+
 class SemanticScholarConnector(Connector):
     source_name = "semanticscholar"
 
     def search(self, query: QuerySpec) -> Iterable[PaperMetadata]:
-        # Build query string; Semantic Scholar supports a simple query parameter
-        q = " ".join(query.keywords or [])
-        if query.authors:
-            q = (q + " " + " ".join(query.authors)).strip()
-
+        q = _query_string(tuple(query.keywords or ()), tuple(query.authors or ()))
         params: dict[str, str] = {
-            "query": q or "*",
+            "query": q,
             "offset": "0",
             "limit": str(query.max_results or 10),
             "fields": "title,abstract,authors,year,venue,externalIds,openAccessPdf,citationCount",
@@ -34,7 +40,7 @@ class SemanticScholarConnector(Connector):
             external_ids = item.get("externalIds") or {}
             doi = external_ids.get("DOI")
             title = item.get("title") or ""
-            authors = [a.get("name", "") for a in (item.get("authors") or [])]
+            authors = [name for a in (item.get("authors") or []) if (name := a.get("name"))]
             abstract = item.get("abstract")
             year = item.get("year")
             venue = item.get("venue")
@@ -49,7 +55,7 @@ class SemanticScholarConnector(Connector):
                 external_id=item.get("paperId"),
                 doi=doi,
                 title=title,
-                authors=[a for a in authors if a],
+                authors=authors,
                 abstract=abstract,
                 license=None,  # license not directly provided in this endpoint
                 pdf_url=pdf_url,
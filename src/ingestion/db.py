@@ -1,22 +1,58 @@
-from sqlalchemy import create_engine, inspect
+import weakref
+
+from sqlalchemy import create_engine, event, inspect, make_url, text
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 
 class Base(DeclarativeBase):
     pass
 
 
+# Engines already checked by ensure_schema in this process (weak: ids of dropped engines
+# can be reused by new ones)
+_schema_checked: weakref.WeakSet = weakref.WeakSet()
+
+
+def _sqlite_pragmas(dbapi_connection, _record) -> None:
+    # WAL + synchronous=NORMAL: commits append to the log without an fsync each, which makes
+    # batched ingest commits cheap; durability is only at risk on power loss, not crashes
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 def create_session_factory(database_url: str) -> sessionmaker:
-    engine = create_engine(database_url, pool_pre_ping=True, future=True)
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory SQLite (tests): every session must see the same single database, so
+        # share one connection across sessions and threads. Other URLs keep the default pool.
+        engine = create_engine(
+            url, poolclass=StaticPool, connect_args={"check_same_thread": False}, future=True
+        )
+    else:
+        engine = create_engine(url, pool_pre_ping=True, future=True)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _sqlite_pragmas)
     return sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
 
 def ensure_schema(base_class: type[DeclarativeBase], engine) -> None:
-    """Best-effort dev helper: if expected columns are missing, drop and recreate tables.
+    """Best-effort dev helper: bring the ``papers`` table up to the mapped schema.
 
-    This is intentionally destructive for developer convenience in Phase-2 and should be
-    replaced by a proper migration tool (e.g., Alembic) in later phases.
+    Missing nullable columns are added in place (with their indexes), keeping existing rows.
+    Any other mismatch is still handled destructively (drop and recreate) for developer
+    convenience in Phase-2, and should be replaced by a proper migration tool (e.g., Alembic)
+    in later phases. The inspection runs at most once per engine per process.
     """
+    if engine in _schema_checked:
+        return
+    _ensure_schema(base_class, engine)
+    _schema_checked.add(engine)
+
+
+def _ensure_schema(base_class: type[DeclarativeBase], engine) -> None:
     inspector = inspect(engine)
     existing_tables = set(inspector.get_table_names())
     # Only handle the single known table for now
@@ -29,7 +65,31 @@ def ensure_schema(base_class: type[DeclarativeBase], engine) -> None:
     existing_columns = {col["name"] for col in inspector.get_columns(expected_table)}
     # Derive expected columns from mapped Table
     expected_columns = {c.name for c in base_class.metadata.tables[expected_table].columns}
-    if not expected_columns.issubset(existing_columns):
-        # Drop and recreate when schema is behind
-        base_class.metadata.drop_all(engine)
-        base_class.metadata.create_all(engine)
+    if expected_columns.issubset(existing_columns):
+        return
+    table = base_class.metadata.tables[expected_table]
+    missing = [c for c in table.columns if c.name not in existing_columns]
+    if all(c.nullable for c in missing):
+        # Additive change: existing rows get NULL, which callers backfill where needed
+        _add_columns(engine, table, missing)
+        return
+    # Drop and recreate when schema is behind
+    base_class.metadata.drop_all(engine)
+    base_class.metadata.create_all(engine)
+
+
+def _add_columns(engine, table, columns) -> None:
+    preparer = engine.dialect.identifier_preparer
+    names = {c.name for c in columns}
+    with engine.begin() as conn:
+        for column in columns:
+            col_type = column.type.compile(dialect=engine.dialect)
+            conn.execute(
+                text(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN {preparer.format_column(column)} {col_type}"
+                )
+            )
+        for index in table.indexes:
+            if names & {c.name for c in index.columns}:
+                index.create(conn)
@@ -1,20 +1,114 @@
 from __future__ import annotations
 
 import hashlib
+import weakref
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_, update
 from sqlalchemy.orm import Session
 
 from .models import Paper
 
+# Engines whose rows all carry identity_hash (backfill_identity_hashes ran in this process);
+# until then, rows stored before the column existed are matched by a fallback scan
+_backfilled: weakref.WeakSet = weakref.WeakSet()
+
 
 def _normalize(s: str | None) -> str:
     return (s or "").strip().lower()
 
 
 def _hash_identity(title: str, authors: list[str]) -> str:
-    payload = f"{_normalize(title)}|{'|'.join(sorted(_normalize(a) for a in authors))}"
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    payload = f"{_normalize(title)}|{'|'.join(sorted(map(_normalize, authors)))}"
+    # Non-cryptographic identity key: a 128-bit BLAKE2b digest is ample at corpus scale and
+    # cheaper than SHA-256 on these short payloads.
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def identity_hash(title: str | None, authors: list[str] | None) -> str | None:
+    """Title/authors fingerprint stored in ``Paper.identity_hash``; None without both."""
+    if title and authors:
+        return _hash_identity(title, authors)
+    return None
+
+
+def identity_keys(
+    source: str,
+    doi: str | None,
+    external_id: str | None,
+    title: str | None = None,
+    authors: list[str] | None = None,
+    *,
+    fingerprint: str | None = None,
+) -> set[tuple]:
+    """Keys :func:`is_duplicate` matches on, for deduplicating records not yet in the DB.
+
+    Pass a precomputed ``fingerprint`` (:func:`identity_hash`) instead of title/authors to
+    avoid normalizing and hashing the same record twice.
+    """
+    keys: set[tuple] = set()
+    if doi:
+        keys.add(("doi", doi))
+    if external_id:
+        keys.add(("external_id", source, external_id))
+    fingerprint = fingerprint or identity_hash(title, authors)
+    if fingerprint:
+        keys.add(("identity", fingerprint))
+    return keys
+
+
+def backfill_identity_hashes(session: Session, batch_size: int = 500) -> int:
+    """Store ``identity_hash`` on rows that predate the column; returns rows updated."""
+    stmt = select(Paper.id, Paper.title, Paper.authors).where(Paper.identity_hash.is_(None))
+    rows = [
+        {"id": pid, "identity_hash": fingerprint}
+        for pid, title, authors in session.execute(stmt)
+        if (fingerprint := identity_hash(title, (authors or {}).get("list")))
+    ]
+    for start in range(0, len(rows), batch_size):
+        session.execute(update(Paper), rows[start : start + batch_size])
+    session.commit()
+    _backfilled.add(session.get_bind())
+    return len(rows)
+
+
+def _unhashed_matches(session: Session, hashes: set[str]) -> set[str]:
+    """``hashes`` matching rows stored without identity_hash, until the backfill has run."""
+    if not hashes or session.get_bind() in _backfilled:
+        return set()
+    stmt = select(Paper.title, Paper.authors).where(Paper.identity_hash.is_(None))
+    found: set[str] = set()
+    for title, authors in session.execute(stmt.execution_options(yield_per=500)):
+        fingerprint = identity_hash(title, (authors or {}).get("list"))
+        if fingerprint in hashes:
+            found.add(fingerprint)
+    return found
+
+
+def existing_keys(session: Session, keys: set[tuple]) -> set[tuple]:
+    """Subset of ``keys`` (from :func:`identity_keys`) already stored, in at most three queries.
+
+    Batch counterpart of :func:`is_duplicate`: a record is a duplicate when any of its keys
+    is returned.
+    """
+    by_kind: dict[str, list[tuple]] = {"doi": [], "external_id": [], "identity": []}
+    for key in keys:
+        by_kind[key[0]].append(key)
+    found: set[tuple] = set()
+    if by_kind["doi"]:
+        stmt = select(Paper.doi).where(Paper.doi.in_([k[1] for k in by_kind["doi"]]))
+        found.update(("doi", doi) for doi in session.execute(stmt).scalars())
+    if by_kind["external_id"]:
+        pairs = [k[1:] for k in by_kind["external_id"]]
+        stmt = select(Paper.source, Paper.external_id).where(
+            tuple_(Paper.source, Paper.external_id).in_(pairs)
+        )
+        found.update(("external_id", src, ext) for src, ext in session.execute(stmt))
+    if by_kind["identity"]:
+        hashes = {k[1] for k in by_kind["identity"]}
+        stmt = select(Paper.identity_hash).where(Paper.identity_hash.in_(hashes))
+        found.update(("identity", h) for h in session.execute(stmt).scalars())
+        found.update(("identity", h) for h in _unhashed_matches(session, hashes))
+    return found
 
 
 def is_duplicate(
@@ -37,14 +131,13 @@ def is_duplicate(
         if session.execute(stmt).scalar_one_or_none() is not None:
             return True
 
-    # Finally, heuristic by title/authors hash
-    if title and authors:
-        identity_hash = _hash_identity(title, authors)
-        # A lightweight scan; in real systems, store this hash in DB column with an index
-        stmt = select(Paper.id, Paper.title, Paper.authors)
-        for _id, existing_title, existing_authors in session.execute(stmt):
-            existing_hash = _hash_identity(existing_title, existing_authors.get("list", []))
-            if existing_hash == identity_hash:
-                return True
+    # Finally, heuristic by title/authors hash (indexed column, computed at insert time)
+    fingerprint = identity_hash(title, authors)
+    if fingerprint:
+        stmt = select(Paper.id).where(Paper.identity_hash == fingerprint).limit(1)
+        if session.execute(stmt).first() is not None:
+            return True
+        if _unhashed_matches(session, {fingerprint}):
+            return True
 
     return False
@@ -1,21 +1,51 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterable
 from typing import Any
 
-from opensearchpy import OpenSearch
+from opensearchpy import JSONSerializer, OpenSearch
+from opensearchpy.exceptions import SerializationError
+from opensearchpy.helpers import bulk
 from sqlalchemy import select
 
 from .config import Settings
-from .db import Base, create_session_factory
+from .db import Base, create_session_factory, ensure_schema
 from .models import Paper
 
+try:  # optional: several times faster request/response (de)serialization
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 INDEX_NAME = os.environ.get("SEARCH_INDEX", "papers")
 
 
+class OrjsonSerializer(JSONSerializer):
+    """JSON serializer backed by orjson; defers to the stdlib one for types orjson rejects."""
+
+    def dumps(self, data: Any) -> str:
+        if isinstance(data, str):
+            return data
+        try:
+            return orjson.dumps(data).decode("utf-8")
+        except TypeError:
+            return super().dumps(data)
+
+    def loads(self, s: str) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(s, e) from e
+
+
+def search_serializer() -> JSONSerializer:
+    return OrjsonSerializer() if orjson is not None else JSONSerializer()
+
+
 def _get_client() -> OpenSearch:
     host = os.environ.get("SEARCH_HOST", "http://localhost:9200")
-    return OpenSearch(hosts=[host])
+    return OpenSearch(hosts=[host], serializer=search_serializer())
 
 
 def ensure_index(client: OpenSearch) -> None:
@@ -53,8 +83,8 @@ def ensure_index(client: OpenSearch) -> None:
         client.indices.create(index=INDEX_NAME, body=mapping)
 
 
-def upsert_document(client: OpenSearch, paper: Paper) -> None:
-    doc = {
+def _to_doc(paper: Paper) -> dict[str, Any]:
+    return {
         "title": paper.title,
         "abstract": paper.abstract,
         "summary": paper.summary,
@@ -68,7 +98,30 @@ def upsert_document(client: OpenSearch, paper: Paper) -> None:
         "citation_count": paper.citation_count,
         "fetched_at": paper.fetched_at.isoformat() if paper.fetched_at else None,
     }
-    client.index(index=INDEX_NAME, id=str(paper.id), body=doc)
+
+
+def upsert_document(client: OpenSearch, paper: Paper) -> None:
+    client.index(index=INDEX_NAME, id=str(paper.id), body=_to_doc(paper))
+
+
+def bulk_index(client: OpenSearch, papers: Iterable[Paper], chunk_size: int = 500) -> int:
+    """Index ``papers`` through the ``_bulk`` API, ``chunk_size`` documents per request.
+
+    Periodic refreshes are paused for the duration of the load and the index is refreshed
+    once at the end. Returns the number of documents indexed.
+    """
+    actions = (
+        {"_op_type": "index", "_index": INDEX_NAME, "_id": str(p.id), "_source": _to_doc(p)}
+        for p in papers
+    )
+    client.indices.put_settings(index=INDEX_NAME, body={"index": {"refresh_interval": "-1"}})
+    try:
+        indexed, _ = bulk(client, actions, chunk_size=chunk_size, request_timeout=60)
+    finally:
+        # None restores the index default
+        client.indices.put_settings(index=INDEX_NAME, body={"index": {"refresh_interval": None}})
+        client.indices.refresh(index=INDEX_NAME)
+    return indexed
 
 
 def main() -> None:
@@ -76,14 +129,15 @@ def main() -> None:
     session_factory = create_session_factory(settings.database_url)
     with session_factory() as session:
         engine = session.get_bind()
-        Base.metadata.create_all(engine)
+        ensure_schema(Base, engine)
 
     client = _get_client()
     ensure_index(client)
 
     with session_factory() as session:
-        for (paper,) in session.execute(select(Paper)):
-            upsert_document(client, paper)
+        # Server-side cursor: rows stream in batches while earlier ones are being indexed
+        stmt = select(Paper).execution_options(stream_results=True, yield_per=500)
+        bulk_index(client, session.execute(stmt).scalars())
 
 
 if __name__ == "__main__":
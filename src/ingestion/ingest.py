@@ -1,31 +1,59 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import islice
 
 from sqlalchemy.orm import sessionmaker
 
 from .connectors.base import PaperMetadata
-from .dedup import is_duplicate
+from .dedup import existing_keys, identity_hash, identity_keys
 from .models import Paper
 from .parser import extract_abstract_and_conclusion, parse_pdf_into_sections
 from .storage import download_pdf_to_storage
 from .utils import (
-    TelemetryCounters,
+    download_rate_limiter,
     license_permits_pdf_storage,
     normalize_license,
-    rate_limit_sleep,
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class IngestResult:
     stored: int
     skipped: int
     errors: int
 
 
+# Records are deduped in windows (one batched lookup each) and their PDFs, which are
+# network-bound, fetched up to this many at once
+_DOWNLOAD_WORKERS = 8
+_WINDOW_SIZE = 64
+# Inserts per transaction: one fsync per this many rows, and a crash loses at most this many
+_COMMIT_EVERY = 200
+
+
+def _pdf_gate() -> Callable[[PaperMetadata], bool]:
+    """Build the per-record "may we store this PDF?" check, reading env overrides once per call."""
+    # Dev/preview overrides: allow storing PDFs without explicit license when enabled
+    if os.environ.get("ALLOW_PDF_WITHOUT_LICENSE", "0") == "1":
+        return lambda rec: True
+    allow_pmc = os.environ.get("ALLOW_PMC_PDF", "0") == "1"
+
+    def permits(rec: PaperMetadata) -> bool:
+        if allow_pmc and rec.source == "pmc":
+            return True
+        return license_permits_pdf_storage(rec.license)
+
+    return permits
+
+
+def _file_hint(rec: PaperMetadata) -> str:
+    return f"{rec.source}-{(rec.external_id or rec.doi or rec.title)[:80]}".strip("-") + ".pdf"
+
+
 def ingest_records(
     records: Iterable[PaperMetadata],
     session_factory: sessionmaker,
@@ -33,82 +61,99 @@ def ingest_records(
     request_timeout_seconds: int,
     rate_limit_delay_seconds: int,
 ) -> IngestResult:
-    counters = TelemetryCounters()
-    with session_factory() as session:
-        for rec in records:
+    ingested = skipped = errors = 0
+    permits_pdf = _pdf_gate()
+
+    def _download(rec: PaperMetadata) -> str:
+        # Per-host pacing: waits only when this host was hit within the delay
+        download_rate_limiter.acquire(rec.pdf_url, rate_limit_delay_seconds)
+        return download_pdf_to_storage(
+            rec.pdf_url,
+            storage_dir=storage_dir,
+            file_hint=_file_hint(rec),
+            timeout_seconds=request_timeout_seconds,
+        )
+
+    it = iter(records)
+    committed = 0
+    with session_factory() as session, ThreadPoolExecutor(_DOWNLOAD_WORKERS) as pool:
+        while window := list(islice(it, _WINDOW_SIZE)):
+            # Dedup on this thread (it owns the session): one batched lookup for the window's
+            # keys, then in-memory checks, which also catch repeats within the window.
+            # Title/authors are normalized and hashed once here; the insert reuses the hash.
+            fingerprints = [identity_hash(rec.title, rec.authors) for rec in window]
+            window_keys = [
+                identity_keys(rec.source, rec.doi, rec.external_id, fingerprint=fp)
+                for rec, fp in zip(window, fingerprints, strict=True)
+            ]
             try:
-                rec.license = normalize_license(rec.license)
-                if is_duplicate(
-                    session,
-                    source=rec.source,
-                    doi=rec.doi,
-                    external_id=rec.external_id,
-                    title=rec.title,
-                    authors=rec.authors,
-                ):
-                    counters.skipped += 1
-                    continue
-
-                pdf_path: str | None = None
-                permit_pdf = license_permits_pdf_storage(rec.license)
-                # Dev/preview overrides: allow storing PDFs without explicit license when enabled
-                if not permit_pdf and os.environ.get("ALLOW_PDF_WITHOUT_LICENSE", "0") == "1":
-                    permit_pdf = True
-                if (
-                    not permit_pdf
-                    and rec.source == "pmc"
-                    and os.environ.get("ALLOW_PMC_PDF", "0") == "1"
-                ):
-                    permit_pdf = True
-
-                if rec.pdf_url and permit_pdf:
-                    file_hint = (
-                        f"{rec.source}-{(rec.external_id or rec.doi or rec.title)[:80]}".strip("-")
-                        + ".pdf"
-                    )
-                    pdf_path = download_pdf_to_storage(
-                        rec.pdf_url,
-                        storage_dir=storage_dir,
-                        file_hint=file_hint,
-                        timeout_seconds=request_timeout_seconds,
+                # Savepoint: a failed lookup must not abort earlier windows' uncommitted inserts
+                with session.begin_nested():
+                    seen_keys = existing_keys(session, set().union(*window_keys))
+            except Exception:  # noqa: BLE001
+                errors += len(window)
+                continue
+            accepted: list[tuple[PaperMetadata, str | None, Future | None]] = []
+            for rec, fp, keys in zip(window, fingerprints, window_keys, strict=True):
+                try:
+                    rec.license = normalize_license(rec.license)
+                    if not seen_keys.isdisjoint(keys):
+                        skipped += 1
+                        continue
+                    seen_keys.update(keys)
+                    download = None
+                    # License only gates records that have something to download
+                    if rec.pdf_url and permits_pdf(rec):
+                        download = pool.submit(_download, rec)
+                    accepted.append((rec, fp, download))
+                except Exception:  # noqa: BLE001
+                    errors += 1
+
+            for rec, fp, download in accepted:
+                try:
+                    pdf_path = download.result() if download is not None else None
+
+                    # Initialize parsed sections if we have a PDF and can extract quickly (best-effort, non-fatal)
+                    sections: dict[str, str] = {}
+                    abstract_txt = rec.abstract
+                    conclusion_txt = None
+                    if pdf_path:
+                        try:
+                            sections = parse_pdf_into_sections(pdf_path)
+                            abs2, concl2 = extract_abstract_and_conclusion(sections)
+                            if abs2 and not abstract_txt:
+                                abstract_txt = abs2
+                            conclusion_txt = concl2
+                        except Exception:
+                            sections = {}
+
+                    paper = Paper(
+                        source=rec.source,
+                        external_id=rec.external_id,
+                        doi=rec.doi,
+                        title=rec.title,
+                        identity_hash=fp,
+                        authors={"list": rec.authors},
+                        abstract=abstract_txt,
+                        license=rec.license,
+                        pdf_path=pdf_path,
+                        sections=sections or {},
+                        conclusion=conclusion_txt,
+                        year=rec.year,
+                        venue=rec.venue,
+                        concepts={"list": rec.concepts or []},
+                        citation_count=rec.citation_count,
                     )
-                    rate_limit_sleep(rate_limit_delay_seconds)
-
-                # Initialize parsed sections if we have a PDF and can extract quickly (best-effort, non-fatal)
-                sections: dict[str, str] = {}
-                abstract_txt = rec.abstract
-                conclusion_txt = None
-                if pdf_path:
-                    try:
-                        sections = parse_pdf_into_sections(pdf_path)
-                        abs2, concl2 = extract_abstract_and_conclusion(sections)
-                        if abs2 and not abstract_txt:
-                            abstract_txt = abs2
-                        conclusion_txt = concl2
-                    except Exception:
-                        sections = {}
-
-                paper = Paper(
-                    source=rec.source,
-                    external_id=rec.external_id,
-                    doi=rec.doi,
-                    title=rec.title,
-                    authors={"list": rec.authors},
-                    abstract=abstract_txt,
-                    license=rec.license,
-                    pdf_path=pdf_path,
-                    sections=sections or {},
-                    conclusion=conclusion_txt,
-                    year=rec.year,
-                    venue=rec.venue,
-                    concepts={"list": rec.concepts or []},
-                    citation_count=rec.citation_count,
-                )
-                session.add(paper)
+                    # Savepoint per record: a bad row rolls back alone, and its flush makes the
+                    # row visible to later duplicate checks before the commit
+                    with session.begin_nested():
+                        session.add(paper)
+                    ingested += 1
+                except Exception:  # noqa: BLE001
+                    errors += 1
+            if ingested - committed >= _COMMIT_EVERY:
                 session.commit()
-                counters.ingested += 1
-            except Exception:  # noqa: BLE001
-                session.rollback()
-                counters.errors += 1
+                committed = ingested
+        session.commit()
 
-    return IngestResult(stored=counters.ingested, skipped=counters.skipped, errors=counters.errors)
+    return IngestResult(stored=ingested, skipped=skipped, errors=errors)
@@ -22,6 +22,8 @@ class Paper(Base):
     external_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
     doi: Mapped[str | None] = mapped_column(String(255), nullable=True, unique=True)
     title: Mapped[str] = mapped_column(String(2048), nullable=False)
+    # blake2b-128 of normalized title + sorted authors (dedup.identity_hash), for indexed dedup
+    identity_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
     authors: Mapped[dict] = mapped_column(
         JSONB().with_variant(GenericJSON(), "sqlite"), default=dict, nullable=False
     )  # {"list": ["Author A", ...]}
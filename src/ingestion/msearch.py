@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any
+
+from opensearchpy import OpenSearch
+
+
+class SearchBatcher:
+    """Coalesce concurrent searches into a single OpenSearch ``_msearch`` round trip.
+
+    Callers block in :meth:`search` while a background thread drains pending requests every
+    ``window_seconds`` (or as soon as ``max_batch`` are queued) and fans the per-request
+    responses back out. Intended for the sync API handlers, which already run in a threadpool.
+    ``filter_path`` is the per-search response filter; it is applied to each item of the batch.
+    ``preference`` is sent in each item's header to pin searches to the same shard copies.
+    """
+
+    def __init__(
+        self,
+        client: OpenSearch,
+        index: str,
+        window_seconds: float = 0.005,
+        max_batch: int = 16,
+        filter_path: str | None = None,
+        preference: str | None = None,
+    ) -> None:
+        self._client = client
+        self._window_seconds = window_seconds
+        self._max_batch = max_batch
+        self._header: dict[str, Any] = {"index": index}
+        if preference:
+            self._header["preference"] = preference
+        self._params: dict[str, str] = {}
+        if filter_path:
+            # Keep per-item errors visible so failures are not mistaken for empty results
+            paths = [f"responses.{p}" for p in filter_path.split(",")] + ["responses.error"]
+            self._params["filter_path"] = ",".join(paths)
+        self._pending: queue.Queue[tuple[dict[str, Any], Future] | None] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="search-batcher", daemon=True)
+        self._thread.start()
+
+    def search(self, body: dict[str, Any], timeout: float | None = 30.0) -> dict[str, Any]:
+        fut: Future = Future()
+        self._pending.put((body, fut))
+        return fut.result(timeout=timeout)
+
+    def close(self) -> None:
+        self._pending.put(None)
+        self._thread.join(timeout=1.0)
+
+    def _run(self) -> None:
+        while True:
+            first = self._pending.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self._window_seconds
+            stop = False
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._pending.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._dispatch(batch)
+            if stop:
+                return
+
+    def _dispatch(self, batch: list[tuple[dict[str, Any], Future]]) -> None:
+        lines: list[dict[str, Any]] = []
+        for body, _ in batch:
+            lines.append(self._header)
+            lines.append(body)
+        try:
+            if self._params:
+                res = self._client.msearch(body=lines, params=self._params)
+            else:
+                res = self._client.msearch(body=lines)
+        except Exception as exc:  # noqa: BLE001
+            for _, fut in batch:
+                fut.set_exception(exc)
+            return
+        responses = res.get("responses", []) or []
+        for i, (_, fut) in enumerate(batch):
+            resp = responses[i] if i < len(responses) else None
+            if resp is None:
+                fut.set_exception(RuntimeError("msearch returned fewer responses than requests"))
+            elif resp.get("error"):
+                fut.set_exception(RuntimeError(f"msearch item failed: {resp['error']}"))
+            else:
+                fut.set_result(resp)
@@ -1,6 +1,42 @@
 from __future__ import annotations
 
+import os
 import re
+import threading
+
+try:  # optional: PDFium (C++) text extraction, several times faster than pdfminer.six
+    import pypdfium2 as pdfium
+except ImportError:  # pragma: no cover - optional dependency
+    pdfium = None  # type: ignore[assignment]
+
+
+def _extract_text(pdf_path: str) -> str:
+    """Extract text with pypdfium2 when installed, else pdfminer.six.
+
+    ``PDF_BACKEND=pdfminer`` forces pdfminer even when pypdfium2 is available.
+    """
+    if pdfium is None or os.environ.get("PDF_BACKEND", "").lower() == "pdfminer":
+        return _extract_text_pdfminer(pdf_path)
+    return _extract_text_pdfium(pdf_path)
+
+
+# PDFium is not thread-safe: one document is open per process at a time
+_PDFIUM_LOCK = threading.Lock()
+
+
+def _extract_text_pdfium(pdf_path: str) -> str:
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            pages: list[str] = []
+            for page in pdf:
+                textpage = page.get_textpage()
+                pages.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
+            return "\n".join(pages)
+        finally:
+            pdf.close()
 
 
 def _extract_text_pdfminer(pdf_path: str) -> str:
@@ -28,6 +64,16 @@ SECTION_NAMES = [
     "Conclusions",
     "References",
 ]
+_SECTION_KEYS = frozenset(s.lower() for s in SECTION_NAMES) | {"body", "title"}
+
+_NEWLINE_RE = re.compile(r"\r\n?")
+# Markers for headers (case-insensitive, standalone line)
+_HEADER_RE = re.compile(
+    r"(abstract|introduction|background|methods?|materials and methods|results|discussion|conclusions?|references)\s*",
+    re.IGNORECASE,
+)
+# Longest header alternative; lines are stripped, so anything longer cannot be a header
+_MAX_HEADER_LEN = len("materials and methods")
 
 
 def split_text_into_sections(text: str) -> dict[str, str]:
@@ -38,25 +84,19 @@ def split_text_into_sections(text: str) -> dict[str, str]:
     if not text:
         return {}
 
-    text = re.sub(r"\r\n?", "\n", text)
-    lines = [ln.strip() for ln in text.split("\n")]
-
-    # Markers for headers (case-insensitive, standalone line)
-    header_pattern = re.compile(
-        r"^(abstract|introduction|background|methods?|materials and methods|results|discussion|conclusions?|references)\s*$",
-        re.IGNORECASE,
-    )
+    raw_lines = _NEWLINE_RE.sub("\n", text).split("\n")
 
-    sections: dict[str, str] = {}
+    # Text chunks per header, joined once at the end (headers can repeat; re-concatenating
+    # the accumulated section on every flush is quadratic)
+    chunks: dict[str, list[str]] = {}
     current_header = "Body"
     buffer: list[str] = []
-    for ln in lines:
-        if header_pattern.match(ln):
+    for raw_ln in raw_lines:
+        ln = raw_ln.strip()
+        if len(ln) <= _MAX_HEADER_LEN and _HEADER_RE.fullmatch(ln):
             # flush previous
             if buffer:
-                sections[current_header] = (
-                    sections.get(current_header, "") + "\n" + "\n".join(buffer)
-                ).strip()
+                chunks.setdefault(current_header, []).append("\n".join(buffer).rstrip())
             # start new
             hdr = ln.strip().title()
             if hdr.lower().startswith("method"):
@@ -69,24 +109,20 @@ def split_text_into_sections(text: str) -> dict[str, str]:
             buffer.append(ln)
 
     if buffer:
-        sections[current_header] = (
-            sections.get(current_header, "") + "\n" + "\n".join(buffer)
-        ).strip()
+        chunks.setdefault(current_header, []).append("\n".join(buffer).rstrip())
+    sections = {key: "\n".join(filter(None, parts)).lstrip() for key, parts in chunks.items()}
 
     # Inject Title if missing by taking the first non-empty line from the document
     if "Title" not in sections:
-        first_nonempty = next((ln for ln in lines if ln), "")
+        # Short-circuits on the first non-empty line, normally within the first few
+        first_nonempty = next(filter(None, map(str.strip, raw_lines)), "")
         if first_nonempty:
             sections["Title"] = first_nonempty
 
     # Keep only known sections + Title/Body
     cleaned: dict[str, str] = {}
     for key, val in sections.items():
-        if (
-            (key in {"Body", "Title"} or any(key.lower() == s.lower() for s in SECTION_NAMES))
-            and val
-            and val.strip()
-        ):
+        if key.lower() in _SECTION_KEYS and val and val.strip():
             cleaned[key] = val.strip()
     return cleaned
 
@@ -96,7 +132,7 @@ def parse_pdf_into_sections(pdf_path: str) -> dict[str, str]:
 
     Returns a dict keyed by canonical section names with raw text.
     """
-    full_text = _extract_text_pdfminer(pdf_path)
+    full_text = _extract_text(pdf_path)
     return split_text_into_sections(full_text)
 
 
@@ -3,10 +3,13 @@ from __future__ import annotations
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
-import requests
+from .utils import build_http_session
 
 TEI_NS = {"tei": "http://www.tei-c.org/ns/1.0"}
 
+# Keep-alive connection to the GROBID server across the PDFs of a run
+_session = build_http_session(retry_gets=False)
+
 
 def _text_or_empty(el) -> str:
     if el is None:
@@ -23,9 +26,11 @@ def grobid_parse_pdf(pdf_path: str, host: str = "http://localhost:8070") -> dict
         url = host.rstrip("/") + "/api/processFulltextDocument"
         with open(Path(pdf_path), "rb") as f:
             files = {"input": (Path(pdf_path).name, f, "application/pdf")}
-            resp = requests.post(url, files=files, timeout=60)
+            resp = _session.post(url, files=files, timeout=60)
         resp.raise_for_status()
-        tei_xml = resp.text or ""
+        # Parse the raw bytes: expat honours the XML declaration's encoding, and resp.text
+        # would first run charset detection over the whole document
+        tei_xml = resp.content or b""
         if not tei_xml.strip():
             return {}
         root = ET.fromstring(tei_xml)
@@ -56,9 +61,9 @@ def grobid_parse_pdf(pdf_path: str, host: str = "http://localhost:8070") -> dict
                 name = "Results"
             # Collect paragraphs
             paras = [
-                _text_or_empty(p).strip()
-                for p in div.findall(".//tei:p", TEI_NS)
-                if _text_or_empty(p).strip()
+                text
+                for p in div.iterfind(".//tei:p", TEI_NS)
+                if (text := _text_or_empty(p).strip())
             ]
             if paras:
                 text = "\n\n".join(paras)
@@ -2,11 +2,17 @@ from __future__ import annotations
 
 import hashlib
 import re
+import shutil
 from pathlib import Path
 
-import requests
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from .utils import build_http_session
+
+# Pooled keep-alive connections for PDF hosts; retries are left to tenacity below
+_session = build_http_session(retry_gets=False)
+_UNSAFE_NAME_CHARS_RE = re.compile(r"[^A-Za-z0-9._-]")
+
 
 def ensure_storage_dir(storage_dir: str) -> Path:
     path = Path(storage_dir)
@@ -26,7 +32,7 @@ def _sanitize_file_name(file_name: str) -> str:
     # Normalize path separators first
     file_name = file_name.replace("\\", "/")
     file_name = file_name.split("/")[-1]
-    return re.sub(r"[^A-Za-z0-9._-]", "_", file_name)
+    return _UNSAFE_NAME_CHARS_RE.sub("_", file_name)
 
 
 @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3))
@@ -45,11 +51,11 @@ def download_pdf_to_storage(
     # Ensure any intermediate directories exist (in case hint contained separators previously)
     dest.parent.mkdir(parents=True, exist_ok=True)
 
-    with requests.get(pdf_url, stream=True, timeout=timeout_seconds) as r:
+    with _session.get(pdf_url, stream=True, timeout=timeout_seconds) as r:
         r.raise_for_status()
+        # Decode any Content-Encoding, then copy in 1 MiB reads rather than looping over 8 KiB
+        r.raw.decode_content = True
         with open(dest, "wb") as f:
-            for chunk in r.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+            shutil.copyfileobj(r.raw, f, length=1 << 20)
 
     return str(dest)
@@ -3,20 +3,29 @@ from __future__ import annotations
 import re
 from typing import Protocol
 
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
 
-def _split_sentences(text: str) -> list[str]:
-    parts = re.split(r"(?<=[.!?])\s+", text.strip())
-    return [p.strip() for p in parts if p.strip()]
+
+def _split_sentences(text: str, limit: int | None = None) -> list[str]:
+    """Sentences of ``text``; with ``limit``, only the first ``limit`` (the rest is not split)."""
+    if limit is None:
+        parts = _SENTENCE_SPLIT_RE.split(text.strip())
+    elif limit <= 0:
+        return []
+    else:
+        # The last part holds the unsplit remainder when the limit was reached
+        parts = _SENTENCE_SPLIT_RE.split(text.strip(), maxsplit=limit)[:limit]
+    return [s for p in parts if (s := p.strip())]
 
 
 def extractive_summary(text: str, max_sentences: int = 5, max_chars: int = 1000) -> str:
     """Simple extractive baseline: return first N sentences up to max chars."""
     if not text:
         return ""
-    sents = _split_sentences(text)
+    sents = _split_sentences(text, limit=max_sentences * 2)
     output: list[str] = []
     total = 0
-    for s in sents[: max_sentences * 2]:
+    for s in sents:
         if not s:
             continue
         if total + len(s) + (1 if output else 0) > max_chars:
@@ -43,13 +52,20 @@ def summarize_sections(sections: dict[str, str]) -> str:
     # Build an ordered list of (sentence, source_section)
     sentences_with_section: list[tuple[str, str]] = []
     seen_sentences: set[str] = set()
+    # Each section is split at most once, and only if a pass below actually reads it
+    split_cache: dict[str, list[str]] = {}
+
+    def sentences_of(key: str) -> list[str]:
+        if key not in split_cache:
+            split_cache[key] = _split_sentences(sections[key])
+        return split_cache[key]
 
     # Collect sentences from preferred sections first
     for key in preferred_order:
         text = sections.get(key)
         if not text:
             continue
-        for sent in _split_sentences(text):
+        for sent in sentences_of(key):
             if sent in seen_sentences:
                 continue
             sentences_with_section.append((sent, key))
@@ -60,7 +76,7 @@ def summarize_sections(sections: dict[str, str]) -> str:
         for key, text in sections.items():
             if key in preferred_order or not text:
                 continue
-            for sent in _split_sentences(text):
+            for sent in sentences_of(key):
                 if sent in seen_sentences:
                     continue
                 sentences_with_section.append((sent, key))
@@ -96,7 +112,7 @@ def summarize_sections(sections: dict[str, str]) -> str:
             text = sections.get(sec)
             if not text:
                 continue
-            sents = _split_sentences(text)
+            sents = sentences_of(sec)
             if sents:
                 target_sent = sents[0]
                 target_sec = sec
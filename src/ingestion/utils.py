@@ -1,38 +1,69 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import queue
+import re
 import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
-from threading import Lock
-from typing import Any
+from functools import lru_cache
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Any, TypeVar
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:  # optional: several times faster JSON encoding/decoding than the stdlib
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
+T = TypeVar("T")
+
+# Known license spellings, most specific first so "cc-by-sa" is not reported as "cc-by"
+_LICENSE_TOKENS: dict[str, str] = {
+    "cc-by-sa": "cc-by-sa",
+    "cc by-sa": "cc-by-sa",
+    "cc-by": "cc-by",
+    "cc by": "cc-by",
+    "creative commons attribution": "cc-by",
+    "cc0": "cc0",
+    "public domain": "public-domain",
+}
+_LICENSE_RE = re.compile("|".join(re.escape(k) for k in _LICENSE_TOKENS))
+
+
+@lru_cache(maxsize=256)
 def normalize_license(raw: str | None) -> str | None:
     """Normalize common open licenses to a stable token.
 
     Returns lowercase simplified identifiers such as:
     - cc-by, cc-by-sa, cc0, public-domain
-    Falls back to the lowercased string if unknown.
+    Falls back to the lowercased string if unknown. Memoized: a corpus carries only a handful
+    of distinct license strings.
     """
     if not raw:
         return None
     s = raw.strip().lower()
-    cc_map: dict[str, str] = {
-        "cc-by": "cc-by",
-        "cc by": "cc-by",
-        "creative commons attribution": "cc-by",
-        "cc-by-sa": "cc-by-sa",
-        "cc by-sa": "cc-by-sa",
-        "cc0": "cc0",
-        "public domain": "public-domain",
-    }
-    for k, v in cc_map.items():
-        if k in s:
-            return v
-    return s
+    m = _LICENSE_RE.search(s)
+    return _LICENSE_TOKENS[m.group(0)] if m else s
+
+
+def dumps_json_line(obj: Any) -> bytes:
+    """Serialize ``obj`` as one newline-terminated UTF-8 JSON line (JSONL)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # e.g. non-str keys; the stdlib encoder coerces them
+    return (json.dumps(obj) + "\n").encode("utf-8")
 
 
 def license_permits_pdf_storage(normalized_license: str | None) -> bool:
@@ -49,29 +80,193 @@ def rate_limit_sleep(seconds: float) -> None:
 class PerSourceRateLimiter:
     """Simple in-process, per-source rate limiter based on minimum interval between calls.
 
-    Not a hard guarantee under concurrency, but adequate for CLI/worker usage.
+    Each call reserves the source's next slot under the lock and sleeps outside it, so
+    concurrent callers of one source are spaced out while other sources are never blocked.
     """
 
     def __init__(self) -> None:
         self._lock = Lock()
-        self._last_call_epoch_seconds: dict[str, float] = {}
+        self._next_allowed: dict[str, float] = {}
 
     def throttle(self, source_name: str, min_interval_seconds: float) -> None:
         if not source_name or min_interval_seconds <= 0:
             return
         with self._lock:
             now = time.monotonic()
-            last = self._last_call_epoch_seconds.get(source_name, 0.0)
-            sleep_for = (last + min_interval_seconds) - now
-            if sleep_for > 0:
-                time.sleep(sleep_for)
-            # record call time after sleeping to be conservative
-            self._last_call_epoch_seconds[source_name] = time.monotonic()
+            slot = max(now, self._next_allowed.get(source_name, now))
+            self._next_allowed[source_name] = slot + min_interval_seconds
+        if slot > now:
+            time.sleep(slot - now)
 
 
 global_rate_limiter = PerSourceRateLimiter()
 
 
+class TokenBucket:
+    """Proactive pacer: allows bursts of ``capacity`` calls, refilled at ``rate`` per second.
+
+    :meth:`consume` only sleeps when the bucket is empty, and does so without holding the lock.
+    A non-positive ``rate`` disables throttling.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = Lock()
+
+    def consume(self, tokens: float = 1.0) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """Paces requests per URL host with one :class:`TokenBucket` each.
+
+    The first request to a host goes out immediately; later ones wait only for that host's
+    own budget, so slow pacing for one PDF host never delays downloads from another.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._buckets: dict[tuple[str, float], TokenBucket] = {}
+
+    def acquire(self, url: str, min_interval_seconds: float) -> None:
+        if not min_interval_seconds or min_interval_seconds <= 0:
+            return
+        key = (urlsplit(url).netloc, float(min_interval_seconds))
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(1.0 / min_interval_seconds, 1.0)
+        bucket.consume()
+
+
+download_rate_limiter = HostRateLimiter()
+
+
+class TTLCache:
+    """Thread-safe in-process LRU cache whose entries expire after ``ttl_seconds``.
+
+    A ``maxsize`` or ``ttl_seconds`` of 0 disables caching entirely.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 60.0) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._lock = Lock()
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0 or self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class HttpResponseCache:
+    """On-disk cache of JSON GET responses keyed by URL + params, revalidated via ETag.
+
+    Entries younger than ``ttl_seconds`` are served without a request. Older entries that
+    carry an ETag are revalidated with ``If-None-Match``, so an unchanged resource costs a
+    304 instead of a full download. 404s are remembered for ``negative_ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        ttl_seconds: float = 24 * 3600,
+        negative_ttl_seconds: float = 3600,
+    ) -> None:
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+
+    def _path(self, url: str, params: dict[str, Any]) -> Path:
+        key = json.dumps([url, sorted((str(k), str(v)) for k, v in params.items())])
+        return self.directory / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def load(self, url: str, params: dict[str, Any]) -> dict[str, Any] | None:
+        try:
+            with open(self._path(url, params), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) else None
+
+    def is_fresh(self, entry: dict[str, Any]) -> bool:
+        ttl = self.negative_ttl_seconds if entry.get("status") == 404 else self.ttl_seconds
+        return time.time() - float(entry.get("stored_at", 0)) < ttl
+
+    def store(self, url: str, params: dict[str, Any], entry: dict[str, Any]) -> None:
+        path = self._path(url, params)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({**entry, "stored_at": time.time()}, f)
+            os.replace(tmp, path)
+        except OSError:
+            # Caching is best-effort; a read-only or full disk must not fail the request
+            pass
+
+
+def build_http_session(*, retry_gets: bool = True) -> requests.Session:
+    """Keep-alive session with a pooled adapter, safe to share across worker threads.
+
+    With ``retry_gets`` the adapter retries GETs on throttling and transient errors; callers
+    that already retry (e.g. with tenacity) should pass ``False``.
+    """
+    retry: Retry | int = 0
+    if retry_gets:
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,  # hand the final response to raise_for_status()
+        )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# One connection pool per process: repeated calls to a provider reuse their TCP/TLS connection
+_http_session = build_http_session()
+
+
 def http_get_json(
     url: str,
     *,
@@ -79,11 +274,18 @@ def http_get_json(
     timeout_seconds: int = 30,
     source_name: str | None = None,
     min_interval_seconds: float = 0.0,
+    cache: HttpResponseCache | None = None,
 ) -> dict[str, Any]:
     """HTTP GET returning JSON with optional per-source throttling.
 
-    Intended for connector APIs that do not require streaming.
+    Intended for connector APIs that do not require streaming. When ``cache`` is given,
+    fresh responses are served from disk and stale ones are revalidated with their ETag.
     """
+    entry = cache.load(url, params or {}) if cache is not None else None
+    if entry is not None and cache is not None and cache.is_fresh(entry):
+        if entry.get("status") == 404:
+            raise requests.HTTPError(f"404 Client Error: Not Found for url: {url} (cached)")
+        return entry.get("body") or {}
     if source_name and min_interval_seconds:
         global_rate_limiter.throttle(source_name, min_interval_seconds)
     # Set polite defaults for providers (e.g., OpenAlex recommends mailto and UA)
@@ -99,16 +301,71 @@ def http_get_json(
     if "openalex.org" in url and contact_email and "mailto" not in effective_params:
         effective_params["mailto"] = contact_email
 
-    r = requests.get(url, params=effective_params, headers=headers, timeout=timeout_seconds)
+    if entry is not None and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+
+    r = _http_session.get(url, params=effective_params, headers=headers, timeout=timeout_seconds)
+    if cache is not None:
+        if r.status_code == 304 and entry is not None:
+            # Unchanged upstream: refresh the entry's age and reuse the stored body
+            cache.store(url, params or {}, entry)
+            return entry.get("body") or {}
+        if r.status_code == 404:
+            cache.store(url, params or {}, {"status": 404})
     r.raise_for_status()
-    data = r.json() or {}
+    # orjson parses the raw bytes directly (no str decode); large result pages benefit most
+    data = (orjson.loads(r.content) if orjson is not None else r.json()) or {}
     if not isinstance(data, dict):
         # normalize non-dict JSON to dict for caller simplicity
-        return {"data": data}
+        data = {"data": data}
+    if cache is not None:
+        cache.store(url, params or {}, {"status": 200, "etag": r.headers.get("ETag"), "body": data})
     return data
 
 
-@dataclass
+def prefetch(iterable: Iterable[T], maxsize: int) -> Iterator[T]:
+    """Iterate ``iterable`` on a background thread, up to ``maxsize`` items ahead of the caller.
+
+    Lets a paged, blocking source (e.g. the next page plus its polite delay) load while the
+    caller processes the current items. Exceptions re-raise in the caller; closing the returned
+    generator early stops the producer at its next item.
+    """
+    buf: queue.Queue[tuple[bool, Any]] = queue.Queue(maxsize=max(1, maxsize))
+    stop = Event()
+    done = object()
+
+    def _put(item: tuple[bool, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                buf.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in iterable:
+                if not _put((True, item)):
+                    return
+            _put((True, done))
+        except BaseException as exc:  # noqa: BLE001 - re-raised on the consumer side
+            _put((False, exc))
+
+    Thread(target=_produce, name="prefetch", daemon=True).start()
+    try:
+        while True:
+            ok, item = buf.get()
+            if not ok:
+                raise item
+            if item is done:
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+@dataclass(slots=True)
 class TelemetryCounters:
     ingested: int = 0
     skipped: int = 0
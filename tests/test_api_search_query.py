@@ -12,10 +12,14 @@ class _FakeSearchClient:
     def __init__(self) -> None:
         self.last_index: str | None = None
         self.last_body: dict[str, Any] | None = None
+        self.last_params: dict[str, Any] | None = None
 
-    def search(self, *, index: str, body: dict[str, Any]) -> dict[str, Any]:  # type: ignore[override]
+    def search(  # type: ignore[override]
+        self, *, index: str, body: dict[str, Any], params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         self.last_index = index
         self.last_body = body
+        self.last_params = params
         # return minimal ES-like response
         return {
             "hits": {
@@ -61,3 +65,32 @@ def test_search_builds_expected_filters(monkeypatch):
     assert rng["range"]["year"]["lte"] == 2022
     # Sort by citations
     assert body["sort"] == [{"citation_count": {"order": "desc"}}]
+    # Response is trimmed server-side
+    assert fake.last_params == {"filter_path": api_mod.SEARCH_FILTER_PATH}
+
+
+class _FakeMsearchClient:
+    def __init__(self) -> None:
+        self.calls: list[list[dict[str, Any]]] = []
+
+    def msearch(self, *, body: list[dict[str, Any]]) -> dict[str, Any]:
+        self.calls.append(body)
+        bodies = body[1::2]
+        return {"responses": [{"hits": {"total": {"value": b["size"]}}} for b in bodies]}
+
+
+def test_search_batcher_coalesces_concurrent_requests():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from ingestion.msearch import SearchBatcher
+
+    fake = _FakeMsearchClient()
+    batcher = SearchBatcher(fake, "papers", window_seconds=0.05, max_batch=8)  # type: ignore[arg-type]
+    try:
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            results = list(ex.map(lambda n: batcher.search({"size": n}), range(1, 5)))
+    finally:
+        batcher.close()
+    assert [r["hits"]["total"]["value"] for r in results] == [1, 2, 3, 4]
+    assert len(fake.calls) < 4
+    assert all(line == {"index": "papers"} for call in fake.calls for line in call[::2])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import time
 from collections.abc import Iterable
 
 import pytest
@@ -69,3 +70,83 @@ def test_fetch_openalex_neighbors_live():
     assert isinstance(neighbors, list)
     # Expect at least some neighbors; threshold low to avoid flakiness
     assert len(neighbors) >= 10
+
+
+def test_fetch_openalex_neighbors_offline(monkeypatch):
+    import ingestion.citations as citations_mod
+
+    def fake_get_json(url: str, *, params=None, **_kwargs):
+        if url.endswith("/doi:10.1234/seed"):
+            assert params == {"select": "id,referenced_works,cited_by_api_url"}
+            return {
+                "id": "https://openalex.org/W0",
+                "cited_by_api_url": "https://api.openalex.org/works?filter=cites:W0",
+                "referenced_works": ["https://openalex.org/W1", "https://openalex.org/W2"],
+            }
+        if "cites:W0" in url:
+            return {"results": [{"doi": "https://doi.org/10.1234/citer"}]}
+        if url == "https://api.openalex.org/works" and params:
+            # References are resolved with one OR-filtered request
+            assert params["filter"] == "openalex:W1|W2"
+            return {"results": [{"doi": "https://doi.org/10.1234/ref1"}, {"doi": None}]}
+        raise AssertionError(f"unexpected url {url}")
+
+    monkeypatch.setattr(citations_mod, "http_get_json", fake_get_json)
+    neighbors = fetch_openalex_neighbors("10.1234/seed")
+    assert sorted(neighbors) == ["https://doi.org/10.1234/citer", "https://doi.org/10.1234/ref1"]
+
+
+def test_openalex_search_by_dois_batches_requests(monkeypatch):
+    import ingestion.connectors.openalex as openalex_mod
+
+    calls: list[dict] = []
+
+    def fake_get_json(url: str, *, params=None, **_kwargs):
+        calls.append(params)
+        dois = params["filter"].removeprefix("doi:").split("|")
+        venue = {"source": {"display_name": "Venue"}}
+        return {
+            "results": [{"doi": d, "title": d, "id": d, "primary_location": venue} for d in dois]
+        }
+
+    monkeypatch.setattr(openalex_mod, "http_get_json", fake_get_json)
+    dois = [f"10.1234/n.{i}" for i in range(60)]
+    records = list(openalex_mod.OpenAlexConnector().search_by_dois(dois))
+    assert [r.doi for r in records] == dois
+    assert len(calls) == 2  # 50 + 10
+    # The venue is read from a field the select= projection requests
+    assert "primary_location" in calls[0]["select"].split(",")
+    assert records[0].venue == "Venue"
+
+
+def test_openalex_doi_search_is_memoized(monkeypatch):
+    import ingestion.connectors.openalex as openalex_mod
+    from ingestion.connectors.base import QuerySpec
+    from ingestion.utils import TTLCache
+
+    calls: list[dict] = []
+
+    def fake_get_json(url: str, *, params=None, **_kwargs):
+        calls.append(params)
+        if "missing" in params["filter"]:
+            return {"results": []}
+        return {"results": [{"doi": "10.1234/memo", "title": "Memo", "id": "W1"}]}
+
+    monkeypatch.setattr(openalex_mod, "http_get_json", fake_get_json)
+    monkeypatch.setattr(openalex_mod, "_doi_cache", TTLCache(maxsize=16, ttl_seconds=60))
+    conn = openalex_mod.OpenAlexConnector()
+    first = list(conn.search(QuerySpec(keywords=["10.1234/memo"])))
+    second = list(conn.search(QuerySpec(keywords=["10.1234/memo"])))
+    assert [r.doi for r in first] == [r.doi for r in second] == ["10.1234/memo"]
+    assert first[0] is not second[0]
+    assert len(calls) == 1
+    # Empty lookups are retried rather than cached
+    for _ in range(2):
+        assert list(conn.search(QuerySpec(keywords=["10.1234/missing"]))) == []
+    assert len(calls) == 3
+    # Expired entries are fetched again
+    monkeypatch.setattr(openalex_mod, "_doi_cache", TTLCache(maxsize=16, ttl_seconds=0.01))
+    list(conn.search(QuerySpec(keywords=["10.1234/memo"])))
+    time.sleep(0.02)
+    list(conn.search(QuerySpec(keywords=["10.1234/memo"])))
+    assert len(calls) == 5
@@ -46,3 +46,142 @@ def test_ingestion_does_not_store_pdf_for_restricted_license(tmp_path: Path):
 
     # Ensure no file was created in storage
     assert not any(tmp_path.iterdir())
+
+
+def test_ingestion_downloads_concurrently_and_dedups_within_batch(tmp_path: Path, monkeypatch):
+    import time
+
+    import ingestion.ingest as ingest_mod
+
+    def fake_download(pdf_url, storage_dir, file_hint=None, timeout_seconds=30):
+        time.sleep(0.2)
+        return str(tmp_path / file_hint)
+
+    monkeypatch.setattr(ingest_mod, "download_pdf_to_storage", fake_download)
+    monkeypatch.setattr(ingest_mod, "parse_pdf_into_sections", lambda path: {})
+    session_factory = create_session_factory("sqlite+pysqlite:///:memory:")
+    with session_factory() as session:
+        ensure_schema(Base, session.get_bind())
+
+    records = [
+        PaperMetadata(
+            source="test",
+            external_id=f"x{i}",
+            doi=f"10.9999/test.{i % 4}",
+            title=f"Paper {i}",
+            authors=["Alice"],
+            license="cc-by",
+            pdf_url=f"http://host{i}.invalid/{i}.pdf",
+        )
+        for i in range(5)
+    ]
+    start = time.monotonic()
+    res = ingest_records(
+        records,
+        session_factory=session_factory,
+        storage_dir=str(tmp_path),
+        request_timeout_seconds=1,
+        rate_limit_delay_seconds=0,
+    )
+    # Four distinct DOIs download in parallel; the fifth record repeats the first DOI
+    assert (res.stored, res.skipped, res.errors) == (4, 1, 0)
+    assert time.monotonic() - start < 0.6
+
+
+def test_ingestion_failed_record_rolls_back_alone(tmp_path: Path):
+    session_factory = create_session_factory(f"sqlite+pysqlite:///{tmp_path / 'db.sqlite'}")
+    with session_factory() as session:
+        ensure_schema(Base, session.get_bind())
+
+    records = [
+        PaperMetadata(source="test", external_id="a", doi="10.9999/a", title="A", authors=["x"]),
+        # NOT NULL title violation: only this record's savepoint is rolled back
+        PaperMetadata(source="test", external_id="b", doi="10.9999/b", title=None, authors=[]),
+        PaperMetadata(source="test", external_id="c", doi="10.9999/c", title="C", authors=["x"]),
+    ]
+    res = ingest_records(
+        records,
+        session_factory=session_factory,
+        storage_dir=str(tmp_path),
+        request_timeout_seconds=1,
+        rate_limit_delay_seconds=0,
+    )
+    assert (res.stored, res.errors) == (2, 1)
+
+    from ingestion.models import Paper
+
+    with session_factory() as session:
+        assert sorted(p.external_id for p in session.query(Paper)) == ["a", "c"]
+
+
+def test_ingestion_dedups_on_stored_identity_hash(tmp_path: Path):
+    session_factory = create_session_factory("sqlite+pysqlite:///:memory:")
+    with session_factory() as session:
+        ensure_schema(Base, session.get_bind())
+
+    def ingest(rec: PaperMetadata):
+        return ingest_records(
+            [rec],
+            session_factory=session_factory,
+            storage_dir=str(tmp_path),
+            request_timeout_seconds=1,
+            rate_limit_delay_seconds=0,
+        )
+
+    first = ingest(PaperMetadata("a", "1", None, "Same Title", ["Bob", "Alice"]))
+    # Different source/id and no DOI: only the title/authors fingerprint matches
+    second = ingest(PaperMetadata("b", "2", None, " same title ", ["alice", "bob"]))
+    assert (first.stored, second.stored, second.skipped) == (1, 0, 1)
+
+
+def test_existing_keys_matches_each_identity_kind(tmp_path: Path):
+    from ingestion.dedup import existing_keys, identity_keys
+
+    session_factory = create_session_factory("sqlite+pysqlite:///:memory:")
+    with session_factory() as session:
+        ensure_schema(Base, session.get_bind())
+    ingest_records(
+        [PaperMetadata("s", "e1", "10.1/x", "Title", ["A"])],
+        session_factory=session_factory,
+        storage_dir=str(tmp_path),
+        request_timeout_seconds=1,
+        rate_limit_delay_seconds=0,
+    )
+
+    stored = identity_keys("s", "10.1/x", "e1", "Title", ["A"])
+    other = identity_keys("s", "10.1/y", "e2", "Other", ["B"])
+    with session_factory() as session:
+        assert existing_keys(session, stored | other) == stored
+
+
+def test_ensure_schema_adds_identity_hash_and_keeps_existing_rows(tmp_path: Path):
+    from sqlalchemy import inspect, text
+
+    from ingestion.dedup import backfill_identity_hashes, is_duplicate
+
+    # A database built before papers.identity_hash existed, holding one paper
+    db_url = f"sqlite:///{tmp_path}/old.db"
+    session_factory = create_session_factory(db_url)
+    engine = session_factory.kw["bind"]
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_papers_identity_hash"))
+        conn.execute(text("ALTER TABLE papers DROP COLUMN identity_hash"))
+        conn.execute(
+            text(
+                "INSERT INTO papers (source, external_id, title, authors, sections, "
+                "parse_attempts, concepts, fetched_at) VALUES ('old', 'o1', 'Legacy Title', "
+                "'{\"list\": [\"Ann\"]}', '{}', 0, '{}', '2024-01-01 00:00:00')"
+            )
+        )
+
+    ensure_schema(Base, engine)
+    inspector = inspect(engine)
+    assert "identity_hash" in {c["name"] for c in inspector.get_columns("papers")}
+    assert "ix_papers_identity_hash" in {i["name"] for i in inspector.get_indexes("papers")}
+    with session_factory() as session:
+        assert session.execute(text("SELECT title FROM papers")).scalars().all() == ["Legacy Title"]
+        # Not yet backfilled: the unhashed row is still found by title/authors
+        assert is_duplicate(session, "new", None, "n1", "legacy title", ["ann"])
+        assert backfill_identity_hashes(session) == 1
+        assert is_duplicate(session, "new", None, "n1", "legacy title", ["ann"])
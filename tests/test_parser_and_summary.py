@@ -110,13 +110,60 @@ def test_scanned_pdf_returns_empty_sections_and_empty_summary(monkeypatch):
     # Mock low-level extractor to simulate scanned/empty text
     import ingestion.parser as parser_mod
 
-    monkeypatch.setattr(parser_mod, "_extract_text_pdfminer", lambda _: "")
+    monkeypatch.setattr(parser_mod, "_extract_text", lambda _: "")
     sections = parser_mod.parse_pdf_into_sections("/tmp/does-not-matter.pdf")
     assert sections == {}
     # With no sections and no abstract, summary is empty
     assert summarize_sections(sections) == ""
 
 
+def test_pdf_text_backend_prefers_pdfium_unless_overridden(monkeypatch):
+    import ingestion.parser as parser_mod
+
+    monkeypatch.setattr(parser_mod, "_extract_text_pdfminer", lambda _: "pdfminer")
+    monkeypatch.setattr(parser_mod, "_extract_text_pdfium", lambda _: "pdfium")
+    monkeypatch.delenv("PDF_BACKEND", raising=False)
+    monkeypatch.setattr(parser_mod, "pdfium", object())
+    assert parser_mod._extract_text("paper.pdf") == "pdfium"
+    monkeypatch.setenv("PDF_BACKEND", "pdfminer")
+    assert parser_mod._extract_text("paper.pdf") == "pdfminer"
+    # Without pypdfium2 installed, pdfminer is used regardless
+    monkeypatch.delenv("PDF_BACKEND")
+    monkeypatch.setattr(parser_mod, "pdfium", None)
+    assert parser_mod._extract_text("paper.pdf") == "pdfminer"
+
+
+def test_pdfium_extraction_is_serialized_across_threads(monkeypatch):
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    import ingestion.parser as parser_mod
+
+    active: list[int] = []
+    overlaps: list[int] = []
+    lock = threading.Lock()
+
+    class FakeDocument:
+        def __init__(self, _path):
+            with lock:
+                active.append(1)
+                overlaps.append(len(active))
+            time.sleep(0.01)
+
+        def __iter__(self):
+            return iter(())
+
+        def close(self):
+            with lock:
+                active.pop()
+
+    monkeypatch.setattr(parser_mod, "pdfium", type("FakePdfium", (), {"PdfDocument": FakeDocument}))
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        list(ex.map(parser_mod._extract_text_pdfium, ["a.pdf"] * 8))
+    assert max(overlaps) == 1
+
+
 def test_summary_includes_results_or_conclusion_when_present():
     sections = {
         "Abstract": "Overview.",
@@ -127,3 +174,81 @@ def test_summary_includes_results_or_conclusion_when_present():
     out = summarize_sections(sections)
     lowered = out.lower()
     assert ("result" in lowered) or ("improved" in lowered) or ("conclusion" in lowered)
+
+
+def test_retro_parse_resume_keeps_first_run_backup(tmp_path, monkeypatch):
+    import dataclasses
+    import json
+
+    import pytest
+
+    import ingestion.cli as cli_mod
+    from ingestion.config import Settings
+    from ingestion.models import Paper
+
+    settings = dataclasses.replace(
+        Settings.from_env(), database_url=f"sqlite:///{tmp_path}/test.db", parser_backend="grobid"
+    )
+    monkeypatch.setattr(cli_mod, "_settings", lambda: settings)
+    session_factory = cli_mod._session_factory(settings.database_url)
+    with session_factory() as session:
+        for i in range(3):
+            session.add(
+                Paper(source="test", external_id=f"e{i}", title=f"T{i}", pdf_path=f"{i}.pdf")
+            )
+        session.commit()
+    sections = {"Abstract": "An abstract.", "Conclusion": "A conclusion."}
+    monkeypatch.setattr(cli_mod, "_parse_pdf", lambda *_: sections)
+    # One paper per batch, so each batch gets its own checkpoint
+    iter_batches = cli_mod._iter_paper_batches
+    monkeypatch.setattr(
+        cli_mod,
+        "_iter_paper_batches",
+        lambda session, columns, start_after=0: iter_batches(
+            session, columns, batch_size=1, start_after=start_after
+        ),
+    )
+    save_checkpoint = cli_mod._save_checkpoint
+
+    def interrupt_after_first(path, last_id):
+        save_checkpoint(path, last_id)
+        raise KeyboardInterrupt
+
+    backup = tmp_path / "backup.jsonl"
+    checkpoint = tmp_path / "retro.ckpt"
+    args = {"backup_file": str(backup), "dry_run": False, "checkpoint_file": str(checkpoint)}
+    monkeypatch.setattr(cli_mod, "_save_checkpoint", interrupt_after_first)
+    with pytest.raises(KeyboardInterrupt):
+        cli_mod.cmd_retro_parse(**args)
+    monkeypatch.setattr(cli_mod, "_save_checkpoint", save_checkpoint)
+    cli_mod.cmd_retro_parse(**args)
+
+    snapshots = [json.loads(line) for line in backup.read_text().splitlines()]
+    # The first run's pre-change snapshot of paper 1 survives the resumed run
+    assert [s["id"] for s in snapshots] == [1, 2, 3]
+    assert all(s["sections"] == {} and s["summary"] is None for s in snapshots)
+
+
+def test_coverage_counts_treat_whitespace_only_text_as_blank(tmp_path, monkeypatch, capsys):
+    import dataclasses
+    import json
+
+    import ingestion.cli as cli_mod
+    from ingestion.config import Settings
+    from ingestion.models import Paper
+
+    settings = dataclasses.replace(Settings.from_env(), database_url=f"sqlite:///{tmp_path}/t.db")
+    monkeypatch.setattr(cli_mod, "_settings", lambda: settings)
+    session_factory = cli_mod._session_factory(settings.database_url)
+    with session_factory() as session:
+        session.add_all(
+            [
+                Paper(source="t", external_id="1", title="A", summary="\n", abstract="\t \n"),
+                Paper(source="t", external_id="2", title="B", summary="Real.", abstract="x"),
+            ]
+        )
+        session.commit()
+    cli_mod.cmd_coverage_counts()
+    counts = json.loads(capsys.readouterr().out)
+    assert counts["total"] == 2
+    assert counts["with_summary"] == 1
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
-from ingestion.utils import PerSourceRateLimiter, license_permits_pdf_storage, normalize_license
+import pytest
+
+import ingestion.utils as utils_mod
+from ingestion.utils import (
+    HostRateLimiter,
+    HttpResponseCache,
+    PerSourceRateLimiter,
+    TokenBucket,
+    TTLCache,
+    license_permits_pdf_storage,
+    normalize_license,
+    prefetch,
+)
 
 
 def test_license_normalization_and_policy():
     assert normalize_license("CC BY 4.0") == "cc-by"
     assert normalize_license("Public Domain") == "public-domain"
+    assert normalize_license("CC BY-SA 4.0") == "cc-by-sa"
     assert license_permits_pdf_storage("cc-by") is True
     assert license_permits_pdf_storage("cc0") is True
     assert license_permits_pdf_storage("public-domain") is True
@@ -21,3 +34,98 @@ def test_per_source_rate_limiter_basic():
     elapsed = __import__("time").monotonic() - start
     # Two calls should incur ~0.2s total at minimum; allow slack on CI
     assert elapsed >= 0.18
+
+
+def test_per_source_rate_limiter_does_not_block_other_sources():
+    import threading
+    import time
+
+    rl = PerSourceRateLimiter()
+    rl.throttle("openalex", 0.5)
+    waiter = threading.Thread(target=rl.throttle, args=("openalex", 0.5))
+    waiter.start()
+    time.sleep(0.05)  # let the waiter reserve its slot and start sleeping
+    start = time.monotonic()
+    rl.throttle("doaj", 0.5)
+    assert time.monotonic() - start < 0.1
+    waiter.join()
+
+
+def test_token_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=20, capacity=2)
+    start = __import__("time").monotonic()
+    for _ in range(4):
+        bucket.consume()
+    elapsed = __import__("time").monotonic() - start
+    # Two calls are free (burst), the next two wait ~0.05s each
+    assert 0.08 <= elapsed < 1.0
+
+
+def test_host_rate_limiter_paces_each_host_independently():
+    limiter = HostRateLimiter()
+    start = __import__("time").monotonic()
+    limiter.acquire("https://a.example/x.pdf", 10)
+    limiter.acquire("https://b.example/y.pdf", 10)  # other host: no wait
+    assert __import__("time").monotonic() - start < 0.5
+    limiter.acquire("https://a.example/z.pdf", 0.05)  # new interval, fresh budget
+    limiter.acquire("https://a.example/z.pdf", 0.05)
+    assert __import__("time").monotonic() - start >= 0.04
+
+
+def test_prefetch_preserves_order_and_reraises():
+    def source():
+        yield from range(5)
+        raise ValueError("page fetch failed")
+
+    seen = []
+    with pytest.raises(ValueError):
+        for item in prefetch(source(), maxsize=2):
+            seen.append(item)
+    assert seen == [0, 1, 2, 3, 4]
+
+
+def test_ttl_cache_expires_and_evicts():
+    cache = TTLCache(maxsize=2, ttl_seconds=0.05)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts least recently used ("b")
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    __import__("time").sleep(0.06)
+    assert cache.get("a") is None
+
+
+def test_http_response_cache_revalidates_with_etag(tmp_path, monkeypatch):
+    class _Resp:
+        def __init__(self, status_code, body=None, etag=None):
+            self.status_code = status_code
+            self._body = body
+            self.headers = {"ETag": etag} if etag else {}
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise utils_mod.requests.HTTPError(str(self.status_code))
+
+        @property
+        def content(self):
+            return __import__("json").dumps(self._body).encode()
+
+        def json(self):
+            return self._body
+
+    sent_headers: list[dict[str, str]] = []
+    replies = [_Resp(200, {"id": "W1"}, etag='"v1"'), _Resp(304)]
+
+    def fake_get(url, *, params, headers, timeout):
+        sent_headers.append(headers)
+        return replies.pop(0)
+
+    monkeypatch.setattr(utils_mod._http_session, "get", fake_get)
+    cache = HttpResponseCache(str(tmp_path), ttl_seconds=0)
+    url = "https://api.openalex.org/works/W1"
+    assert utils_mod.http_get_json(url, cache=cache) == {"id": "W1"}
+    # Stale entry: revalidated with the stored ETag, body served from disk on 304
+    assert utils_mod.http_get_json(url, cache=cache) == {"id": "W1"}
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"v1"'